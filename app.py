@@ -1,9 +1,10 @@
 import streamlit as st
 import pandas as pd
-import json
 import os
-from generator import SyntheticDataGenerator
-from validate import DataValidator
+from generator import get_generator_pool
+from validate import IncrementalValidator
+from schema_registry import get_registry
+from writers import to_bytes
 import matplotlib.pyplot as plt
 import seaborn as sns
 from datetime import datetime
@@ -15,19 +16,162 @@ st.set_page_config(
     layout="wide"
 )
 
+# Bounded caches: each entry holds a generated frame, so keep only a handful per server.
+GENERATION_CACHE_ENTRIES = 16
+
+@st.cache_data(max_entries=GENERATION_CACHE_ENTRIES, show_spinner=False)
+def generate_dataset(fingerprint: str, domain: str, num_rows: int, seed: int,
+                     inject_edge_cases: bool, inject_noise: bool, noise_range: float):
+    """Generate a seeded dataset and its validation report, memoized on every setting that affects them.
+    
+    The schema fingerprint is part of the key, so editing a domain file invalidates its entries.
+    """
+    schema = get_registry().schema(domain)
+    # Pooled generators keep their Faker instance between clicks; each is reseeded per request.
+    with get_generator_pool().acquire(
+        seed=seed,
+        inject_edge_cases=inject_edge_cases,
+        inject_noise=inject_noise,
+        noise_range=noise_range,
+        profile=True
+    ) as generator:
+        # Statistics are accumulated chunk by chunk while the data is generated.
+        validator = IncrementalValidator(schema).attach(generator)
+        df = generator.generate_data(schema, num_rows)
+        profile = generator.profile.report()
+    
+    report = validator.report()
+    report['analysis'] = report['analysis'].to_dict()
+    report['profile'] = profile
+    return df, report
+
+@st.cache_data(max_entries=GENERATION_CACHE_ENTRIES * 3, show_spinner=False)
+def histogram_figure(settings_key: tuple, field: str, _df: pd.DataFrame):
+    fig, ax = plt.subplots(figsize=(10, 6))
+    plt.hist(_df[field].dropna(), bins=30, alpha=0.7, edgecolor='black')
+    plt.title(f'Distribution of {field}')
+    plt.xlabel(field)
+    plt.ylabel('Frequency')
+    plt.grid(True, alpha=0.3)
+    plt.close()
+    return fig
+
+@st.cache_data(max_entries=GENERATION_CACHE_ENTRIES, show_spinner=False)
+def export_bytes(settings_key: tuple, output_format: str, _df: pd.DataFrame) -> bytes:
+    domain = get_registry().get(dict(settings_key)['domain'])
+    return to_bytes(_df, output_format, domain.plan)
+
+def render_result(result: dict, show_statistics: bool, show_histograms: bool):
+    settings = result['settings']
+    settings_key = tuple(sorted(settings.items()))
+    df = result['df']
+    report = result['report']
+    analysis = report['analysis']
+    selected_domain = settings['domain']
+    
+    st.success(f"✅ Successfully generated {settings['num_rows']} rows of {selected_domain} data (seed {settings['seed']})!")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Total Rows", len(df))
+    with col2:
+        st.metric("Total Columns", len(df.columns))
+    with col3:
+        st.metric("Domain", selected_domain)
+    with col4:
+        numeric_cols = len([col for col in df.columns if pd.api.types.is_numeric_dtype(df[col].dtype)])
+        st.metric("Numeric Fields", numeric_cols)
+    
+    st.subheader("📊 Generated Data Preview")
+    st.dataframe(df, use_container_width=True)
+    
+    if show_statistics:
+        st.subheader("📈 Statistical Analysis")
+        
+        if analysis['numeric_summary']:
+            st.write("**Numeric Field Statistics:**")
+            numeric_df = pd.DataFrame(analysis['numeric_summary']).T
+            st.dataframe(numeric_df[['count', 'mean', 'std', 'min', 'max', 'median']], use_container_width=True)
+        
+        if analysis['categorical_summary']:
+            st.write("**Categorical Field Summary:**")
+            for field, stats in analysis['categorical_summary'].items():
+                st.write(f"- **{field}**: {stats['unique_values']} unique values")
+                if stats['most_common']:
+                    st.write(f"  Most common: {list(stats['most_common'].keys())[:3]}")
+        
+        if report['outliers']:
+            st.write("**Outliers (IQR):**")
+            outliers_df = pd.DataFrame({field: outliers for field, outliers in report['outliers'].items() if outliers}).T
+            st.dataframe(outliers_df, use_container_width=True)
+        
+        consistency = report['consistency']
+        if consistency['inconsistent_rows']:
+            st.warning(f"⚠️ {consistency['inconsistent_rows']} rows violate cross-field rules: "
+                       + ", ".join(f"{issue} ({count})" for issue, count in consistency['violations'].items() if count))
+        else:
+            st.write("**Cross-field Consistency:** no violations")
+    
+    if show_histograms and analysis['numeric_summary']:
+        st.subheader("\U0001F4CA Distribution Plots")
+        # Exclude boolean columns from numeric_fields
+        numeric_fields = [
+            field for field in analysis['numeric_summary'].keys()
+            if pd.api.types.is_numeric_dtype(df[field]) and not pd.api.types.is_bool_dtype(df[field])
+        ]
+        for field in numeric_fields[:3]:
+            st.pyplot(histogram_figure(settings_key, field, df))
+    
+    with st.expander("⏱️ Generation Profile"):
+        profile = report['profile']
+        st.write(f"{profile['total_seconds']:.2f}s of generation work for {profile['rows']:,} rows")
+        fields_df = pd.DataFrame(profile['fields']).T
+        st.dataframe(fields_df[['type', 'seconds', 'share', 'us_per_cell', 'calls', 'bytes']], use_container_width=True)
+        st.dataframe(pd.DataFrame(profile['stages']).T, use_container_width=True)
+    
+    st.subheader("📥 Download Data")
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.download_button(
+            label="Download CSV",
+            data=export_bytes(settings_key, 'csv', df),
+            file_name=f"{selected_domain.lower()}_synthetic_data.csv",
+            mime="text/csv",
+            use_container_width=True
+        )
+    
+    with col2:
+        try:
+            parquet = export_bytes(settings_key, 'parquet', df)
+        except ImportError:
+            st.caption("Install pyarrow for Parquet downloads")
+        else:
+            st.download_button(
+                label="Download Parquet",
+                data=parquet,
+                file_name=f"{selected_domain.lower()}_synthetic_data.parquet",
+                mime="application/vnd.apache.parquet",
+                use_container_width=True
+            )
+    
+    with col3:
+        if st.button("🔄 Regenerate with Same Settings", use_container_width=True):
+            # Same seed and settings give the same data, so this redraws from session state.
+            st.rerun()
+
 def main():
     st.sidebar.title("🔬 Smart Synthetic Data Generator")
     st.sidebar.markdown("Generate realistic synthetic data for multiple domains")
     
-    domains_dir = "domains"
-    if not os.path.exists(domains_dir):
+    registry = get_registry()
+    if not os.path.exists(registry.domains_dir):
         st.error("Domains directory not found!")
         return
     
-    domain_files = [f for f in os.listdir(domains_dir) if f.endswith('.json')]
-    domain_names = [f.replace('.json', '').title() for f in domain_files]
+    domain_names = [name.title() for name in registry.names()]
     
-    if not domain_files:
+    if not domain_names:
         st.error("No domain schema files found in domains/ directory!")
         return
     
@@ -38,9 +182,6 @@ def main():
         help="Choose the domain for synthetic data generation"
     )
     
-    selected_file = f"{selected_domain.lower()}.json"
-    schema_path = os.path.join(domains_dir, selected_file)
-    
     num_rows = st.sidebar.slider(
         "Number of Rows",
         min_value=10,
@@ -91,97 +232,47 @@ def main():
         help="Display detailed statistical analysis"
     )
     
+    st.sidebar.markdown("---")
+    seed = st.sidebar.number_input(
+        "Random Seed",
+        min_value=0,
+        max_value=2**32 - 1,
+        value=42,
+        step=1,
+        help="The same seed and settings always produce the same data (and reuse cached results)"
+    )
+    
+    settings = {
+        'domain': selected_domain,
+        'num_rows': num_rows,
+        'seed': int(seed),
+        'inject_edge_cases': inject_edge_cases,
+        'inject_noise': inject_noise,
+        'noise_range': noise_range
+    }
+    
     if st.sidebar.button("🚀 Generate Synthetic Data", type="primary", use_container_width=True):
         try:
-            with open(schema_path, 'r') as f:
-                schema = json.load(f)
-            
-            generator = SyntheticDataGenerator(
-                inject_edge_cases=inject_edge_cases,
-                inject_noise=inject_noise,
-                noise_range=noise_range
-            )
-            
-            if not generator.validate_schema(schema):
+            try:
+                domain = registry.get(selected_domain)
+            except ValueError:
                 st.error("❌ Invalid schema format!")
                 return
             
             with st.spinner("Generating synthetic data..."):
-                df = generator.generate_data(schema, num_rows)
-            
-            st.success(f"✅ Successfully generated {num_rows} rows of {selected_domain} data!")
-            
-            col1, col2, col3, col4 = st.columns(4)
-            with col1:
-                st.metric("Total Rows", len(df))
-            with col2:
-                st.metric("Total Columns", len(df.columns))
-            with col3:
-                st.metric("Domain", selected_domain)
-            with col4:
-                numeric_cols = len([col for col in df.columns if pd.api.types.is_numeric_dtype(df[col].dtype)])
-                st.metric("Numeric Fields", numeric_cols)
+                df, report = generate_dataset(domain.fingerprint, **settings)
             
-            st.subheader("📊 Generated Data Preview")
-            st.dataframe(df, use_container_width=True)
-            
-            if show_statistics:
-                st.subheader("📈 Statistical Analysis")
-                
-                validator = DataValidator()
-                analysis = validator.analyze_distributions(df)
-                
-                if analysis['numeric_summary']:
-                    st.write("**Numeric Field Statistics:**")
-                    numeric_df = pd.DataFrame(analysis['numeric_summary']).T
-                    st.dataframe(numeric_df[['count', 'mean', 'std', 'min', 'max', 'median']], use_container_width=True)
-                
-                if analysis['categorical_summary']:
-                    st.write("**Categorical Field Summary:**")
-                    for field, stats in analysis['categorical_summary'].items():
-                        st.write(f"- **{field}**: {stats['unique_values']} unique values")
-                        if stats['most_common']:
-                            st.write(f"  Most common: {list(stats['most_common'].keys())[:3]}")
-            
-            if show_histograms and analysis['numeric_summary']:
-                st.subheader("\U0001F4CA Distribution Plots")
-                # Exclude boolean columns from numeric_fields
-                numeric_fields = [
-                    field for field in analysis['numeric_summary'].keys()
-                    if pd.api.types.is_numeric_dtype(df[field]) and not pd.api.types.is_bool_dtype(df[field])
-                ]
-                if numeric_fields:
-                    for field in numeric_fields[:3]:
-                        fig, ax = plt.subplots(figsize=(10, 6))
-                        plt.hist(df[field].dropna(), bins=30, alpha=0.7, edgecolor='black')
-                        plt.title(f'Distribution of {field}')
-                        plt.xlabel(field)
-                        plt.ylabel('Frequency')
-                        plt.grid(True, alpha=0.3)
-                        st.pyplot(fig)
-                        plt.close()
-            
-            st.subheader("📥 Download Data")
-            
-            csv = df.to_csv(index=False)
-            
-            col1, col2 = st.columns(2)
-            with col1:
-                st.download_button(
-                    label="Download CSV",
-                    data=csv,
-                    file_name=f"{selected_domain.lower()}_synthetic_data.csv",
-                    mime="text/csv",
-                    use_container_width=True
-                )
-            
-            with col2:
-                if st.button("🔄 Regenerate with Same Settings", use_container_width=True):
-                    st.rerun()
-                
+            # Kept across reruns so toggling display options never regenerates the data. The
+            # fingerprint keys the derived caches (plots, downloads) to the same schema version.
+            st.session_state['result'] = {'settings': dict(settings, fingerprint=domain.fingerprint),
+                                          'df': df, 'report': report}
         except Exception as e:
             st.error(f"❌ Error generating data: {str(e)}")
     
+    result = st.session_state.get('result')
+    if result is not None:
+        render_result(result, show_statistics, show_histograms)
+    
     st.title("🔬 Smart Synthetic Data Generator")
     st.markdown("Generate realistic synthetic data for healthcare, finance, and retail domains")
     
@@ -207,8 +298,7 @@ def main():
     with st.expander("📋 Domain Information"):
         if selected_domain:
             try:
-                with open(schema_path, 'r') as f:
-                    schema = json.load(f)
+                schema = registry.schema(selected_domain)
                 
                 st.write(f"**{selected_domain} Schema:**")
                 for field_name, field_metadata in schema['fields'].items():
@@ -0,0 +1,423 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence
+import numpy as np
+import pandas as pd
+import validate
+from generator import FAKER_PROVIDERS, SyntheticDataGenerator
+from schema_registry import DEFAULT_DOMAINS_DIR, get_registry
+from validate import DataValidator
+
+VECTORIZED_TYPES = (set(SyntheticDataGenerator.INTEGER_TYPES) | set(SyntheticDataGenerator.FLOAT_TYPES)
+                    | set(SyntheticDataGenerator.CHOICE_ALIASES) | {'choice', 'boolean', 'date'})
+
+# Suite defaults: row counts per case, the largest row count timed for Faker-backed field
+# types (their µs/cell does not depend on the row count), the largest row count timed for
+# domains (every bundled domain has Faker fields, so 1M rows would take hours on the row
+# engine; raise it with --max-domain-rows) and the throughput drop, relative to the
+# baseline, that counts as a regression.
+SUITE_ROWS = (1_000, 10_000, 100_000, 1_000_000)
+FAKER_ROW_LIMIT = 10_000
+DOMAIN_ROW_LIMIT = 10_000
+REGRESSION_TOLERANCE = 0.20
+
+# Both generation engines are timed: the row engine is the default in the app, the service
+# and GeneratorPool; the columnar engine is opt-in.
+ENGINES = {'row': False, 'columnar': True}
+
+GENERATION_MODES = {
+    'default': {},
+    'edge_cases': {'inject_edge_cases': True},
+    'noise': {'inject_noise': True, 'noise_range': 0.05},
+}
+
+def _rows_per_second(schema, num_rows: int, columnar: bool, workers: int = 1) -> float:
+    generator = SyntheticDataGenerator(columnar=columnar, seed=0, workers=workers)
+    start = time.perf_counter()
+    generator.generate_data(schema, num_rows)
+    return num_rows / (time.perf_counter() - start)
+
+def benchmark_generation(num_rows: int = 10000, domains_dir: str = DEFAULT_DOMAINS_DIR):
+    print("⏱️  Benchmarking row loop vs columnar engine")
+    print("=" * 50)
+    
+    registry = get_registry(domains_dir)
+    
+    for name in registry.names():
+        domain_name = name.title()
+        schema = registry.schema(name)
+        
+        vectorized_schema = {'fields': {name: meta for name, meta in schema['fields'].items()
+                                        if meta.get('type') in VECTORIZED_TYPES}}
+        
+        for label, bench_schema in ((domain_name, schema), (f"{domain_name} (vectorized fields)", vectorized_schema)):
+            row_loop = _rows_per_second(bench_schema, num_rows, columnar=False)
+            columnar = _rows_per_second(bench_schema, num_rows, columnar=True)
+            print(f"{label:<32} row loop: {row_loop:>12,.0f} rows/s   "
+                  f"columnar: {columnar:>12,.0f} rows/s   ({columnar / row_loop:.1f}x)")
+
+def benchmark_uuids(num_rows: int = 1_000_000):
+    print("\n⏱️  Benchmarking UUID generation")
+    print("=" * 50)
+    
+    generator = SyntheticDataGenerator(seed=0)
+    sample = min(num_rows, 100_000)
+    
+    start = time.perf_counter()
+    for _ in range(sample):
+        generator.fake.uuid4()
+    faker_rate = sample / (time.perf_counter() - start)
+    print(f"{'fake.uuid4()':<24} {faker_rate:>12,.0f} rows/s")
+    
+    for label, unique in (("bulk", False), ("bulk (unique)", True)):
+        start = time.perf_counter()
+        generator.generate_uuids(num_rows, unique=unique)
+        rate = num_rows / (time.perf_counter() - start)
+        print(f"{label:<24} {rate:>12,.0f} rows/s   ({rate / faker_rate:.1f}x)")
+
+def benchmark_workers(num_rows: int = 20000, domains=("healthcare", "finance", "retail"), domains_dir: str = DEFAULT_DOMAINS_DIR):
+    print("\n⏱️  Benchmarking process-pool scaling")
+    print("=" * 50)
+    
+    worker_counts = sorted({1, 2, 4, os.cpu_count() or 1})
+    
+    for domain in domains:
+        schema = get_registry(domains_dir).schema(domain)
+        
+        baseline = None
+        for workers in worker_counts:
+            rate = _rows_per_second(schema, num_rows, columnar=True, workers=workers)
+            baseline = baseline or rate
+            print(f"{domain.title():<12} workers={workers:<3} {rate:>12,.0f} rows/s   ({rate / baseline:.2f}x)")
+
+def benchmark_perturbation(num_rows: int = 1_000_000):
+    print("\n⏱️  Benchmarking noise and edge-case injection")
+    print("=" * 50)
+    
+    generator = SyntheticDataGenerator(seed=0, inject_edge_cases=True, inject_noise=True, noise_range=0.05)
+    metadata = {"type": "integer", "min": 0, "max": 1000}
+    column = generator.np_random.integers(0, 1000, size=num_rows, endpoint=True)
+    
+    start = time.perf_counter()
+    values = []
+    for value in column.tolist():
+        edge_value = generator.inject_edge_case("integer", metadata)
+        values.append(edge_value if edge_value is not None else generator.apply_noise(value, metadata))
+    per_cell = num_rows / (time.perf_counter() - start)
+    print(f"{'per cell':<24} {per_cell:>12,.0f} rows/s")
+    
+    edge_cases = generator._edge_case_values("integer", metadata)
+    start = time.perf_counter()
+    generator.inject_edge_case_column(generator.apply_noise_column(column, precision=2), edge_cases)
+    masked = num_rows / (time.perf_counter() - start)
+    print(f"{'column masks':<24} {masked:>12,.0f} rows/s   ({masked / per_cell:.1f}x)")
+
+def benchmark_generator_pool(requests: int = 50, rows: int = 10, domain: str = "healthcare",
+                             domains_dir: str = DEFAULT_DOMAINS_DIR):
+    print("\n⏱️  Benchmarking small-request latency: new vs pooled generators")
+    print("=" * 50)
+    
+    from generator import GeneratorPool
+    
+    schema = get_registry(domains_dir).schema(domain)
+    
+    # Seeded requests as the app makes them, and unseeded pooled-Faker requests as the service makes them.
+    configs = (("seeded", {}, True), ("use_pools", {'use_pools': True, 'pool_size': 1000}, False))
+    for config_label, options, seeded in configs:
+        pool = GeneratorPool()
+        
+        def fresh(seed):
+            SyntheticDataGenerator(seed=seed, **options).generate_data(schema, rows)
+        
+        def pooled(seed):
+            with pool.acquire(seed=seed, **options) as generator:
+                generator.generate_data(schema, rows)
+        
+        baseline = None
+        for label, request in (("new generator", fresh), ("generator pool", pooled)):
+            latencies = []
+            for i in range(requests):
+                start = time.perf_counter()
+                request(i if seeded else None)
+                latencies.append(time.perf_counter() - start)
+            median = float(np.median(latencies)) * 1000
+            baseline = baseline or median
+            print(f"{label + f' ({config_label})':<32} median {median:>9.2f} ms   "
+                  f"p95 {np.percentile(latencies, 95) * 1000:>9.2f} ms   ({baseline / median:.1f}x)")
+
+def benchmark_service(requests: int = 200, rows: int = 10, domain: str = "healthcare",
+                      domains_dir: str = DEFAULT_DOMAINS_DIR):
+    print("\n⏱️  Benchmarking small concurrent requests")
+    print("=" * 50)
+    
+    import asyncio
+    from concurrent.futures import ThreadPoolExecutor
+    from service import GenerationService
+    
+    schema = get_registry(domains_dir).schema(domain)
+    start = time.perf_counter()
+    for _ in range(requests):
+        SyntheticDataGenerator().generate_data(schema, rows)
+    fresh = requests / (time.perf_counter() - start)
+    print(f"{'fresh generator each':<24} {fresh:>12,.0f} requests/s")
+    
+    async def concurrent_requests():
+        async with GenerationService(domains_dir, executor=ThreadPoolExecutor(max_workers=1)) as service:
+            started = time.perf_counter()
+            await asyncio.gather(*(service.generate(domain, rows) for _ in range(requests)))
+            return requests / (time.perf_counter() - started), service.stats['batches']
+    
+    batched, batches = asyncio.run(concurrent_requests())
+    print(f"{'service (batched)':<24} {batched:>12,.0f} requests/s   ({batched / fresh:.1f}x, {batches} batches)")
+
+def benchmark_imports(modules=("generator", "validate", "schema_registry", "cli"), repeats: int = 3):
+    print("\n⏱️  Benchmarking import time (fresh interpreter, best of %d)" % repeats)
+    print("=" * 50)
+    
+    heavy = ("faker", "scipy", "matplotlib", "seaborn", "streamlit")
+    script = ("import sys, time; start = time.perf_counter(); import {module}; elapsed = time.perf_counter() - start; "
+              "print(elapsed, ','.join(m for m in {heavy!r} if m in sys.modules))")
+    
+    for module in modules:
+        runs = []
+        for _ in range(repeats):
+            output = subprocess.run([sys.executable, "-c", script.format(module=module, heavy=heavy)],
+                                    capture_output=True, text=True, check=True).stdout.split()
+            runs.append(float(output[0]))
+        loaded = output[1] if len(output) > 1 else "none"
+        print(f"{module:<18} {min(runs) * 1000:>8.0f} ms   heavy modules loaded: {loaded}")
+
+def _reset_peak_rss() -> bool:
+    """Reset the kernel's resident-set high-water mark for this process (Linux only)."""
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+def _peak_rss_mb() -> float:
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+def _measure(name: str, group: str, rows: int, cells: int, func: Callable[[], Any], repeats: int) -> Dict[str, Any]:
+    """Best-of-repeats timing of one case, with the process's peak RSS while it ran."""
+    _reset_peak_rss()
+    seconds = float('inf')
+    for _ in range(repeats):
+        # Swallow the generator's consistency warnings so they don't interleave with the table.
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            func()
+        seconds = min(seconds, time.perf_counter() - start)
+    seconds = max(seconds, 1e-9)
+    
+    return {
+        'name': name,
+        'group': group,
+        'rows': rows,
+        'seconds': seconds,
+        'rows_per_sec': rows / seconds,
+        'us_per_cell': seconds * 1e6 / max(cells, 1),
+        'peak_rss_mb': _peak_rss_mb(),
+    }
+
+def field_type_schemas() -> Dict[str, Dict[str, Any]]:
+    """A one-field schema for every field type generate_field_value accepts."""
+    field_types = (set(SyntheticDataGenerator.INTEGER_TYPES) | set(SyntheticDataGenerator.FLOAT_TYPES)
+                   | set(SyntheticDataGenerator.CHOICE_ALIASES) | set(FAKER_PROVIDERS)
+                   | {'choice', 'boolean', 'date', 'uuid', 'address', 'text'})
+    schemas = {}
+    for field_type in sorted(field_types):
+        metadata = {'type': field_type}
+        if field_type == 'choice':
+            metadata['options'] = ['A', 'B', 'C', 'D']
+        schemas[field_type] = {'fields': {'value': metadata}}
+    return schemas
+
+def _generation_cases(row_counts: Sequence[int], domains_dir: str, engines: Sequence[str] = tuple(ENGINES),
+                      max_rows: Optional[int] = DOMAIN_ROW_LIMIT):
+    registry = get_registry(domains_dir)
+    row_counts = [rows for rows in row_counts if max_rows is None or rows <= max_rows]
+    for name in registry.names():
+        schema = registry.schema(name)
+        for mode, options in GENERATION_MODES.items():
+            for engine in engines:
+                for rows in row_counts:
+                    def run(schema=schema, rows=rows, options=options, columnar=ENGINES[engine]):
+                        SyntheticDataGenerator(columnar=columnar, seed=0, **options).generate_data(schema, rows)
+                    yield f"generate/{name}/{mode}/{engine}", 'domain', rows, rows * len(schema['fields']), run
+
+def _field_type_cases(row_counts: Sequence[int], engines: Sequence[str] = tuple(ENGINES)):
+    compiler = SyntheticDataGenerator()
+    for field_type, schema in field_type_schemas().items():
+        faker_backed = compiler.compile_field(schema['fields']['value']).kind == 'faker'
+        for engine in engines:
+            for rows in row_counts:
+                if faker_backed and rows > FAKER_ROW_LIMIT:
+                    continue
+                def run(schema=schema, rows=rows, columnar=ENGINES[engine]):
+                    SyntheticDataGenerator(columnar=columnar, seed=0).generate_data(schema, rows)
+                yield f"field/{field_type}/{engine}", 'field_type', rows, rows, run
+
+def _validation_cases(row_counts: Sequence[int], domains_dir: str, domain: str = 'retail'):
+    schema = get_registry(domains_dir).schema(domain)
+    validator = DataValidator(schema)
+    
+    for rows in row_counts:
+        # Pools keep building a 1M-row input cheap; the validators only see the finished frame.
+        df = SyntheticDataGenerator(columnar=True, seed=0, use_pools=True).generate_data(schema, rows)
+        other = SyntheticDataGenerator(columnar=True, seed=1, use_pools=True).generate_data(schema, rows)
+        numeric = list(validator.analyze_distributions(df).numeric_fields)
+        field = 'product_price'
+        cells = rows * len(df.columns)
+        
+        def uncached(method):
+            # analyze_distributions memoizes by frame fingerprint; time the computation, not the cache hit.
+            def run():
+                validate._ANALYSIS_CACHE.clear()
+                method()
+            return run
+        
+        cases = {
+            'analyze_distributions': (cells, uncached(lambda: validator.analyze_distributions(df, exact=True))),
+            'analyze_distributions/sketch': (cells, uncached(lambda: validator.analyze_distributions(df, exact=False))),
+            'analyze_chunks': (cells, lambda: validator.analyze_chunks(
+                df.iloc[start:start + validate.DEFAULT_CHUNK_SIZE] for start in range(0, rows, validate.DEFAULT_CHUNK_SIZE))),
+            'generate_histograms': (rows * len(numeric), lambda: validator.generate_histograms(df, numeric)),
+            'test_normality': (rows, lambda: validator.test_normality(df, field)),
+            'compare_distributions': (2 * rows, lambda: validator.compare_distributions(df, other, field)),
+            'detect_outliers/iqr': (rows, lambda: validator.detect_outliers(df, field, 'iqr')),
+            'detect_outliers/zscore': (rows, lambda: validator.detect_outliers(df, field, 'zscore')),
+            'find_consistency_violations': (cells, lambda: validator.find_consistency_violations(df)),
+            'validate_cross_field_consistency': (cells, lambda: validator.validate_cross_field_consistency(df)),
+            'generate_summary_report': (cells, uncached(lambda: validator.generate_summary_report(df))),
+        }
+        for method, (method_cells, run) in cases.items():
+            yield f"validate/{method}", 'validation', rows, method_cells, run
+
+def run_suite(row_counts: Sequence[int] = SUITE_ROWS, groups: Sequence[str] = ('domain', 'field_type', 'validation'),
+              domains_dir: str = DEFAULT_DOMAINS_DIR, verbose: bool = True,
+              engines: Sequence[str] = tuple(ENGINES), max_domain_rows: Optional[int] = DOMAIN_ROW_LIMIT) -> Dict[str, Any]:
+    """Time every domain and field type on each engine, and every DataValidator method, at each row count.
+    
+    Domain cases above max_domain_rows (None for no limit) are skipped.
+    """
+    sources = {
+        'domain': lambda: _generation_cases(row_counts, domains_dir, engines, max_domain_rows),
+        'field_type': lambda: _field_type_cases(row_counts, engines),
+        'validation': lambda: _validation_cases(row_counts, domains_dir),
+    }
+    
+    results = []
+    for group in groups:
+        for name, case_group, rows, cells, run in sources[group]():
+            result = _measure(name, case_group, rows, cells, run, repeats=3 if rows <= 10_000 else 1)
+            results.append(result)
+            if verbose:
+                print(f"{name:<48} {rows:>10,} rows {result['rows_per_sec']:>14,.0f} rows/s "
+                      f"{result['us_per_cell']:>10.3f} µs/cell {result['peak_rss_mb']:>9.1f} MB")
+    
+    return {
+        'metadata': {
+            'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'numpy': np.__version__,
+            'pandas': pd.__version__,
+            'row_counts': list(row_counts),
+            'max_domain_rows': max_domain_rows,
+        },
+        'results': results,
+    }
+
+def compare_to_baseline(suite: Dict[str, Any], baseline: Dict[str, Any],
+                        tolerance: float = REGRESSION_TOLERANCE) -> List[Dict[str, Any]]:
+    """Annotate results with their change against a stored baseline and return the regressions."""
+    reference = {(result['name'], result['rows']): result for result in baseline.get('results', [])}
+    regressions = []
+    
+    for result in suite['results']:
+        previous = reference.get((result['name'], result['rows']))
+        if previous is None:
+            continue
+        
+        result['baseline_rows_per_sec'] = previous['rows_per_sec']
+        result['change'] = result['rows_per_sec'] / previous['rows_per_sec'] - 1
+        result['regression'] = result['change'] < -tolerance
+        if result['regression']:
+            regressions.append(result)
+    
+    return regressions
+
+def run_legacy_benchmarks():
+    benchmark_generation()
+    benchmark_uuids()
+    benchmark_workers()
+    benchmark_perturbation()
+    benchmark_generator_pool()
+    benchmark_service()
+    benchmark_imports()
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark generation and validation throughput.")
+    parser.add_argument('--suite', action='store_true',
+                        help="run the benchmark suite instead of the engine comparisons")
+    parser.add_argument('--rows', type=int, nargs='+', default=list(SUITE_ROWS), help="row counts to benchmark")
+    parser.add_argument('--groups', nargs='+', choices=('domain', 'field_type', 'validation'),
+                        default=['domain', 'field_type', 'validation'], help="which cases to run")
+    parser.add_argument('--engines', nargs='+', choices=tuple(ENGINES), default=list(ENGINES),
+                        help="generation engines to time (default: both)")
+    parser.add_argument('--max-domain-rows', type=int, default=DOMAIN_ROW_LIMIT,
+                        help="largest row count timed for domain cases; 0 for no limit (default: 10000)")
+    parser.add_argument('--output', help="write the suite results to this JSON file")
+    parser.add_argument('--baseline', help="JSON results of an earlier run to compare against")
+    parser.add_argument('--tolerance', type=float, default=REGRESSION_TOLERANCE,
+                        help="fractional throughput drop flagged as a regression (default: 0.20)")
+    args = parser.parse_args(argv)
+    
+    if not args.suite:
+        run_legacy_benchmarks()
+        return 0
+    
+    print("⏱️  Benchmark suite")
+    print("=" * 50)
+    suite = run_suite(args.rows, args.groups, engines=args.engines, max_domain_rows=args.max_domain_rows or None)
+    
+    regressions = []
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare_to_baseline(suite, json.load(f), args.tolerance)
+        
+        print(f"\n{len(regressions)} regression(s) against {args.baseline} (tolerance {args.tolerance:.0%})")
+        for result in regressions:
+            print(f"⚠️  {result['name']} @ {result['rows']:,} rows: {result['rows_per_sec']:,.0f} rows/s "
+                  f"vs {result['baseline_rows_per_sec']:,.0f} ({result['change']:+.0%})")
+    
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(suite, f, indent=2)
+        print(f"Results written to {args.output}")
+    
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
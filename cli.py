@@ -0,0 +1,135 @@
+"""Headless batch generation: python -m cli <domain or schema.json> --rows N --output data.csv
+
+Imports only the generator and schema registry, never Streamlit or plotting libraries.
+"""
+import argparse
+import contextlib
+import sys
+import time
+from typing import List, Optional
+from generator import DEFAULT_CHUNK_SIZE, SyntheticDataGenerator
+from schema_registry import get_registry
+from relational import write_tables
+from writers import WRITERS, open_writer
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m cli', description="Generate synthetic data without the Streamlit app.")
+    parser.add_argument('schema', help="domain name (e.g. retail) or path to a schema JSON file")
+    parser.add_argument('-n', '--rows', type=int,
+                        help="number of rows to generate (default: 1000); for multi-table schemas, "
+                             "rows of each root table (default: as declared)")
+    parser.add_argument('-o', '--output', default='-',
+                        help="output path, '-' for stdout; .gz/.bz2/.xz suffixes compress CSV and JSON Lines; "
+                             "a directory for multi-table schemas")
+    parser.add_argument('-f', '--format', choices=list(WRITERS),
+                        help="output format (default: from the output extension; parquet and arrow need pyarrow)")
+    parser.add_argument('--seed', type=int, help="seed for reproducible output")
+    parser.add_argument('-w', '--workers', type=int, default=1, help="worker processes (default: 1)")
+    parser.add_argument('--chunk-size', type=int,
+                        help=f"rows per streamed chunk (default: {DEFAULT_CHUNK_SIZE:,}, or rows split evenly across --workers)")
+    parser.add_argument('--row-engine', action='store_true', help="generate row by row instead of column-at-a-time")
+    parser.add_argument('--edge-cases', action='store_true', help="inject edge-case values")
+    parser.add_argument('--noise', type=float, default=0.0, help="inject ±noise into numeric fields, e.g. 0.05")
+    parser.add_argument('--pools', action='store_true', help="draw Faker string fields from pre-generated pools")
+    parser.add_argument('--profile', action='store_true', help="print per-field and per-stage timings to stderr")
+    parser.add_argument('-q', '--quiet', action='store_true', help="no progress output")
+    return parser
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.rows is not None and args.rows < 0:
+        print("error: --rows must not be negative", file=sys.stderr)
+        return 2
+    if args.workers < 1:
+        print("error: --workers must be at least 1", file=sys.stderr)
+        return 2
+    if args.chunk_size is not None and args.chunk_size < 1:
+        print("error: --chunk-size must be at least 1", file=sys.stderr)
+        return 2
+    
+    try:
+        domain = get_registry().resolve(args.schema)
+    except (KeyError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    
+    generator = SyntheticDataGenerator(
+        inject_edge_cases=args.edge_cases,
+        inject_noise=args.noise > 0,
+        noise_range=args.noise,
+        columnar=not args.row_engine,
+        seed=args.seed,
+        workers=args.workers,
+        use_pools=args.pools,
+        profile=args.profile
+    )
+    progress = sys.stderr if not args.quiet else None
+    interactive = progress is not None and progress.isatty()
+    
+    if domain.is_relational:
+        return _write_relational(args, domain, generator, progress)
+    
+    args.rows = 1000 if args.rows is None else args.rows
+    if args.chunk_size is None:
+        args.chunk_size = DEFAULT_CHUNK_SIZE
+        if args.workers > 1:
+            # Like generate_data: at least one shard per worker, so every process gets work.
+            args.chunk_size = max(1, min(args.chunk_size, -(-args.rows // args.workers)))
+    start = time.perf_counter()
+    rows_written = 0
+    sink = sys.stdout.buffer if args.output == '-' and args.format in ('parquet', 'arrow') else args.output
+    try:
+        writer = open_writer(sink, args.format, domain.plan)
+    except (ImportError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    
+    # The generator reports consistency warnings with print(); keep them out of data written to stdout.
+    diagnostics = contextlib.redirect_stdout(sys.stderr) if args.output == '-' else contextlib.nullcontext()
+    with writer, diagnostics:
+        for chunk in generator.generate_chunks(domain.schema, args.rows, args.chunk_size):
+            writer.write(chunk)
+            rows_written = writer.rows_written
+            
+            if progress is not None:
+                elapsed = time.perf_counter() - start
+                print(f"{rows_written:,}/{args.rows:,} rows ({rows_written / max(args.rows, 1):.0%}) "
+                      f"{rows_written / elapsed:,.0f} rows/s", end='\r' if interactive else '\n', file=progress)
+    
+    if progress is not None:
+        elapsed = time.perf_counter() - start
+        if interactive:
+            print(file=progress)
+        print(f"Wrote {rows_written:,} {domain.title} rows to {args.output} "
+              f"in {elapsed:.2f}s ({rows_written / max(elapsed, 1e-9):,.0f} rows/s)", file=progress)
+    
+    if generator.profile is not None:
+        print(generator.profile.format_report(), file=sys.stderr)
+    return 0
+
+def _write_relational(args, domain, generator, progress) -> int:
+    """One file per table in the output directory, streamed table by table."""
+    if args.output == '-':
+        print("error: multi-table schemas need --output DIRECTORY", file=sys.stderr)
+        return 2
+    
+    rows = None if args.rows is None else {table.name: args.rows for table in domain.tables if table.parent is None}
+    chunk_size = args.chunk_size or DEFAULT_CHUNK_SIZE
+    start = time.perf_counter()
+    try:
+        written = write_tables(generator, domain.schema, args.output, args.format or 'csv', chunk_size, rows)
+    except ImportError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    
+    if progress is not None:
+        elapsed = time.perf_counter() - start
+        for table, count in written.items():
+            print(f"Wrote {count:,} {table} rows", file=progress)
+        print(f"Wrote {sum(written.values()):,} {domain.title} rows to {args.output} in {elapsed:.2f}s", file=progress)
+    if generator.profile is not None:
+        print(generator.profile.format_report(), file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,164 @@
+import ast
+import numpy as np
+import pandas as pd
+from typing import Any, Callable, Dict, List, Optional, Union
+
+_COMPARE_OPS = {
+    ast.Lt: np.less,
+    ast.LtE: np.less_equal,
+    ast.Gt: np.greater,
+    ast.GtE: np.greater_equal,
+    ast.Eq: np.equal,
+    ast.NotEq: np.not_equal,
+}
+
+_BINARY_OPS = {
+    ast.Add: np.add,
+    ast.Sub: np.subtract,
+    ast.Mult: np.multiply,
+    ast.Div: np.true_divide,
+}
+
+ON_VIOLATION_ACTIONS = ('flag', 'resample')
+
+def _compile_operand(node: ast.AST, fields: List[str]) -> Callable[[Dict[str, np.ndarray]], Any]:
+    if isinstance(node, ast.Name):
+        name = node.id
+        if name not in fields:
+            fields.append(name)
+        return lambda columns: columns[name]
+    
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) and not isinstance(node.value, bool):
+        value = node.value
+        return lambda columns: value
+    
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        # Quoted literals are dates, e.g. admit_date >= '2020-01-01'.
+        value = np.datetime64(node.value)
+        return lambda columns: value
+    
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPS:
+        op = _BINARY_OPS[type(node.op)]
+        left = _compile_operand(node.left, fields)
+        right = _compile_operand(node.right, fields)
+        return lambda columns: op(left(columns), right(columns))
+    
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+        operand = _compile_operand(node.operand, fields)
+        return lambda columns: np.negative(operand(columns))
+    
+    raise ValueError(f"Unsupported expression: {ast.unparse(node)}")
+
+def compile_rule(spec: Union[str, Dict]) -> Dict:
+    """Parse a rule such as "discharge_date >= admit_date" or "0 <= age <= 120" once.
+
+    A rule is either an expression string or {"rule": ..., "message": ..., "on_violation": ...}.
+    The compiled rule evaluates over whole columns and flags rows where the comparison fails;
+    rows with a missing operand never violate.
+    """
+    if isinstance(spec, str):
+        spec = {'rule': spec}
+    
+    if not isinstance(spec, dict) or not isinstance(spec.get('rule'), str):
+        raise ValueError("A rule must be an expression string or an object with a 'rule' expression")
+    
+    expression = spec['rule']
+    on_violation = spec.get('on_violation', 'flag')
+    if on_violation not in ON_VIOLATION_ACTIONS:
+        raise ValueError(f"Unknown on_violation action '{on_violation}' in rule '{expression}'")
+    
+    try:
+        tree = ast.parse(expression, mode='eval').body
+    except SyntaxError:
+        raise ValueError(f"Invalid rule expression: '{expression}'")
+    
+    if not isinstance(tree, ast.Compare) or not all(type(op) in _COMPARE_OPS for op in tree.ops):
+        raise ValueError(f"Rule '{expression}' must be a comparison")
+    
+    fields = []
+    operands = [_compile_operand(node, fields) for node in [tree.left] + tree.comparators]
+    operators = [_COMPARE_OPS[type(op)] for op in tree.ops]
+    if not fields:
+        raise ValueError(f"Rule '{expression}' does not reference any field")
+    
+    def holds(columns: Dict[str, np.ndarray]) -> np.ndarray:
+        values = [operand(columns) for operand in operands]
+        result = np.ones(len(columns[fields[0]]), dtype=bool)
+        for op, left, right in zip(operators, values, values[1:]):
+            result &= op(left, right)
+        return result
+    
+    return {
+        'issue': spec.get('message', f"Violates rule: {expression}"),
+        'expression': expression,
+        'fields': fields,
+        'holds': holds,
+        'on_violation': on_violation,
+    }
+
+# Name-based fallback rules, used only when no schema is given (e.g. DataValidator() on an
+# arbitrary frame). With a schema, only the rules it declares apply.
+CONSISTENCY_RULES = [
+    compile_rule({'rule': 'discharge_date >= admit_date', 'message': 'Discharge date before admit date'}),
+    compile_rule({'rule': 'shipping_date >= order_date', 'message': 'Shipping date before order date'}),
+    compile_rule({'rule': '0 <= age <= 120', 'message': 'Age out of reasonable range'}),
+    compile_rule({'rule': '300 <= credit_score <= 850', 'message': 'Credit score out of valid range'}),
+]
+
+def compile_rules(schema: Dict) -> List[Dict]:
+    """Compile a schema's declared "rules"; the name-based CONSISTENCY_RULES never apply to a schema."""
+    declared = []
+    for spec in schema.get('rules', []):
+        rule = compile_rule(spec)
+        unknown = [field for field in rule['fields'] if field not in schema.get('fields', {})]
+        if unknown:
+            raise ValueError(f"Rule '{rule['expression']}' references unknown fields: {', '.join(unknown)}")
+        declared.append(rule)
+    
+    return declared
+
+def _column_values(series: pd.Series) -> np.ndarray:
+    """Numeric or datetime64 values of a column, with unparseable entries as NaN/NaT."""
+    if pd.api.types.is_datetime64_any_dtype(series.dtype):
+        return series.to_numpy()
+    
+    if pd.api.types.is_numeric_dtype(series.dtype) or pd.api.types.is_bool_dtype(series.dtype):
+        return series.to_numpy(dtype=float, na_value=np.nan)
+    
+    numeric = pd.to_numeric(series, errors='coerce')
+    if numeric.notna().any() or series.isna().all():
+        return numeric.to_numpy(dtype=float, na_value=np.nan)
+    
+    return pd.to_datetime(series, errors='coerce').to_numpy()
+
+def rule_mask(df: pd.DataFrame, rule: Dict) -> np.ndarray:
+    """Boolean mask of the rows violating a rule; missing values never violate."""
+    columns = {field: _column_values(df[field]) for field in rule['fields']}
+    present = np.ones(len(df), dtype=bool)
+    for values in columns.values():
+        present &= ~pd.isna(values)
+    
+    with np.errstate(invalid='ignore'):
+        return present & ~rule['holds'](columns)
+
+def applicable_rules(df: pd.DataFrame, rules: Optional[List[Dict]] = None) -> List[Dict]:
+    rules = CONSISTENCY_RULES if rules is None else rules
+    return [rule for rule in rules if all(field in df.columns for field in rule['fields'])]
+
+def find_consistency_violations(df: pd.DataFrame, rules: Optional[List[Dict]] = None) -> Dict[str, np.ndarray]:
+    """Evaluate each rule over the whole frame and return the index labels of failing rows per rule."""
+    violations = {}
+    
+    for rule in applicable_rules(df, rules):
+        violations[rule['issue']] = df.index.to_numpy()[rule_mask(df, rule)]
+    
+    return violations
+
+def count_inconsistent_rows(df: pd.DataFrame, rules: Optional[List[Dict]] = None) -> int:
+    """Number of rows that violate at least one rule."""
+    bad = np.zeros(len(df), dtype=bool)
+    
+    for rule in applicable_rules(df, rules):
+        bad |= rule_mask(df, rule)
+    
+    return int(bad.sum())
@@ -1,18 +1,161 @@
 import pandas as pd
 import numpy as np
-from faker import Faker
 import random
-from typing import Dict, List, Any, Optional
+import json
+import hashlib
+import os
+import sys
+import threading
+import time
+import zlib
+from collections import OrderedDict, deque
+from contextlib import contextmanager, nullcontext
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Callable, Iterator, Sequence, Tuple
 from datetime import datetime, timedelta
 import re
+from consistency import applicable_rules, compile_rules, count_inconsistent_rows, rule_mask
+from profiling import GenerationProfile, column_nbytes
+
+# Faker-backed field types that map directly onto a provider method.
+FAKER_PROVIDERS = {
+    'name': 'name',
+    'email': 'email',
+    'phone': 'phone_number',
+    'company': 'company',
+    'city': 'city',
+    'state': 'state',
+    'country': 'country',
+    'zipcode': 'zipcode',
+}
+
+# Faker-backed field types whose values can be drawn from a pre-generated pool.
+POOLABLE_TYPES = {'name', 'email', 'phone', 'address', 'company', 'city', 'state', 'country', 'zipcode'}
+
+PLAN_CACHE_SIZE = 64
+DEFAULT_CHUNK_SIZE = 100_000
+DEFAULT_POOL_SIZE = 10_000
+# Idle generators kept per configuration by GeneratorPool.
+GENERATOR_POOL_IDLE = 4
+
+_HEX_DIGITS = np.frombuffer(b'0123456789abcdef', dtype=np.uint8)
+# Positions of the 32 hex digits inside the canonical 36-character UUID string.
+_UUID_HEX_POSITIONS = np.array([i for i in range(36) if i not in (8, 13, 18, 23)])
+_UUID_INDEX_MASK = (1 << 62) - 1
+MAX_RESAMPLE_ATTEMPTS = 100
+_PLAN_CACHE: "OrderedDict[str, Tuple[Tuple[CompiledField, ...], List[Dict]]]" = OrderedDict()
+
+def format_uuids(raw: np.ndarray) -> np.ndarray:
+    """Format an (n, 16) uint8 array as n canonical lowercase UUID strings in one pass."""
+    nibbles = np.empty((len(raw), 32), dtype=np.uint8)
+    nibbles[:, 0::2] = raw >> 4
+    nibbles[:, 1::2] = raw & 0x0F
+    
+    chars = np.full((len(raw), 36), ord('-'), dtype=np.uint8)
+    chars[:, _UUID_HEX_POSITIONS] = _HEX_DIGITS[nibbles]
+    return chars.view('S36').ravel().astype('U36').astype(object)
+
+def parse_uuids(values: Sequence[str]) -> np.ndarray:
+    """Inverse of format_uuids: canonical UUID strings to an (n, 16) uint8 array, 16 bytes per key."""
+    chars = np.asarray(values, dtype='S36').view(np.uint8).reshape(-1, 36)
+    digits = chars[:, _UUID_HEX_POSITIONS] | 0x20
+    nibbles = np.where(digits >= ord('a'), digits - (ord('a') - 10), digits - ord('0'))
+    if len(chars) and ((nibbles > 15).any() or (chars[:, [8, 13, 18, 23]] != ord('-')).any()):
+        raise ValueError("Expected canonical 36-character UUID strings")
+    return ((nibbles[:, 0::2] << 4) | nibbles[:, 1::2]).astype(np.uint8)
+
+def _stage(profile: Optional[GenerationProfile], stage: str):
+    return profile.stage(stage) if profile is not None else nullcontext()
+
+def schema_fingerprint(schema: Dict) -> str:
+    """Content hash of a schema's fields and rules (or tables), stable across key order within each field."""
+    fields = [[name, metadata] for name, metadata in schema.get('fields', {}).items()]
+    content = [fields, schema.get('rules', [])]
+    if 'tables' in schema:
+        content.append(schema['tables'])
+    payload = json.dumps(content, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+@dataclass(frozen=True)
+class PoolConfig:
+    """Per-field value pool settings; unset values fall back to the generator defaults."""
+    size: Optional[int] = None
+    unique: bool = False
+    max_bytes: Optional[int] = None
+
+@dataclass(frozen=True)
+class CompiledField:
+    """A schema field with defaults, bounds, options and edge cases resolved once."""
+    name: str
+    type: str
+    kind: str
+    value: Callable[['SyntheticDataGenerator'], Any]
+    low: Any = None
+    high: Any = None
+    precision: int = 2
+    noise_precision: int = 2
+    options: Tuple[Any, ...] = ()
+    options_attr: Optional[str] = None
+    edge_cases: Tuple[Any, ...] = ()
+    pool: Optional[PoolConfig] = None
+    pool_enabled: Optional[bool] = None
+    unique: bool = False
 
 class SyntheticDataGenerator:
     
-    def __init__(self, inject_edge_cases: bool = False, inject_noise: bool = False, noise_range: float = 0.05):
-        self.fake = Faker()
+    # Field types the columnar engine draws as a single array: default (min, max) for
+    # integer-like types, (min, max, precision) for float-like types and the attribute
+    # holding the option list for categorical aliases.
+    INTEGER_TYPES = {
+        'integer': (1, 100),
+        'age': (18, 85),
+        'salary': (30000, 150000),
+        'credit_score': (300, 850),
+        'quantity': (1, 100),
+    }
+    FLOAT_TYPES = {
+        'float': (0.0, 1000.0, 2),
+        'transaction': (10.0, 10000.0, 2),
+        'account_balance': (-5000.0, 50000.0, 2),
+        'price': (1.0, 1000.0, 2),
+        'rating': (1.0, 5.0, 1),
+    }
+    CHOICE_ALIASES = {
+        'gender': 'genders',
+        'transaction_type': 'transaction_types',
+        'product_category': 'product_categories',
+        'currency': 'currencies',
+        'employment_status': 'employment_status',
+        'education': 'education_levels',
+    }
+    
+    def __init__(self, inject_edge_cases: bool = False, inject_noise: bool = False, noise_range: float = 0.05,
+                 columnar: bool = False, seed: Optional[int] = None, workers: int = 1,
+                 use_pools: bool = False, pool_size: int = DEFAULT_POOL_SIZE, pool_dir: Optional[str] = None,
+                 categorical: bool = True, profile: bool = False, locale: Optional[str] = None):
+        if workers < 1:
+            raise ValueError("workers must be a positive integer")
+        
         self.inject_edge_cases = inject_edge_cases
         self.inject_noise = inject_noise
         self.noise_range = noise_range
+        self.columnar = columnar
+        self.workers = workers
+        self.use_pools = use_pools
+        self.pool_size = pool_size
+        self.pool_dir = pool_dir
+        # Choice-style columns come out as pd.Categorical; False keeps plain string columns.
+        self.categorical = categorical
+        self.locale = locale
+        self._pools: Dict[Tuple[str, PoolConfig], np.ndarray] = {}
+        # Callbacks handed every chunk as it is produced, e.g. IncrementalValidator.update.
+        self.subscribers: List[Callable[[pd.DataFrame], None]] = []
+        # Opt-in per-field and per-stage timings, accumulated across runs; hooks get each run's report.
+        self.profile: Optional[GenerationProfile] = GenerationProfile() if profile else None
+        self.profile_hooks: List[Callable[[Dict[str, Any]], None]] = []
+        self._fake = None
+        self.reseed(seed)
         
         self.genders = ['Male', 'Female', 'Other']
         self.transaction_types = ['Purchase', 'Sale', 'Refund', 'Transfer', 'Deposit', 
@@ -26,265 +169,695 @@ class SyntheticDataGenerator:
                                 'Associate', 'Certificate', 'Diploma']
         
         self.edge_case_probability = 0.05
-        
-    def inject_edge_case(self, field_type: str, field_metadata: Dict[str, Any]) -> Any:
-        """Inject edge cases for robustness testing."""
-        if not self.inject_edge_cases or random.random() > self.edge_case_probability:
-            return None
-            
+        self._edge_case_cache: Dict[Tuple[str, str], Tuple[Any, ...]] = {}
+        
+    def reseed(self, seed: Optional[int] = None) -> "SyntheticDataGenerator":
+        """Restart every random stream as if the generator had been created with seed.
+        
+        The Faker instance and compiled plans are kept, which is what makes a reused generator
+        cheaper than a new one. Value pools are kept too unless a different seed is given,
+        since seeded pools are drawn from the seed.
+        """
+        if self._pools and seed is not None and seed != self.seed:
+            self._pools = {}
+        self.seed = seed
+        # Private RNGs keep runs reproducible and independent of other users of the
+        # module-level random state; Faker gets its own seeded instance as well.
+        self.random = random.Random(seed)
+        self.np_random = np.random.default_rng(seed)
+        # Worker shard seeds are spawned from this per call, so repeated parallel calls advance
+        # like the serial stream does instead of replaying the same shards.
+        self._shard_seeds = np.random.SeedSequence(seed)
+        self._faker_seed = seed if seed is not None else self.random.getrandbits(64)
+        if self._fake is not None:
+            self._fake.seed_instance(self._faker_seed)
+        # Key for unique UUID columns; shared with worker shards so keys stay unique across them.
+        self.uuid_key = int(np.random.SeedSequence(seed).generate_state(1, np.uint64)[0]) & _UUID_INDEX_MASK
+        self._uuid_keys: Dict[Tuple[int, str], Tuple[np.uint64, np.uint64]] = {}
+        return self
+    
+    @property
+    def fake(self):
+        """Seeded Faker instance, created on first use so purely numeric work never imports Faker."""
+        if self._fake is None:
+            from faker import Faker
+            self._fake = Faker(self.locale)
+            self._fake.seed_instance(self._faker_seed)
+        return self._fake
+    
+    def _edge_case_values(self, field_type: str, field_metadata: Dict[str, Any]) -> List[Any]:
+        """Edge case values for a field type, or an empty list if it has none."""
         if field_type == "name":
-            edge_cases = ["", "N/A", "Test User", "Anonymous", "Unknown", "John Doe", "Jane Smith"]
-            return random.choice(edge_cases)
-            
+            return ["", "N/A", "Test User", "Anonymous", "Unknown", "John Doe", "Jane Smith"]
+        
         elif field_type == "email":
-            edge_cases = ["", "test@test.com", "admin@company.com", "no-reply@example.com", "invalid-email"]
-            return random.choice(edge_cases)
-            
+            return ["", "test@test.com", "admin@company.com", "no-reply@example.com", "invalid-email"]
+        
         elif field_type == "integer":
             min_val = field_metadata.get("min", 0)
             max_val = field_metadata.get("max", 100)
-            edge_cases = [min_val - 1, max_val + 1, 0, -1, 999999]
-            return random.choice(edge_cases)
-            
+            return [min_val - 1, max_val + 1, 0, -1, 999999]
+        
         elif field_type == "float":
             min_val = field_metadata.get("min", 0.0)
             max_val = field_metadata.get("max", 1000.0)
-            edge_cases = [min_val - 0.01, max_val + 0.01, 0.0, -0.01, 999999.99]
-            return random.choice(edge_cases)
-            
+            return [min_val - 0.01, max_val + 0.01, 0.0, -0.01, 999999.99]
+        
         elif field_type == "choice":
-            options = field_metadata.get("options", [])
-            edge_cases = ["", "N/A", "Other", "Unknown", "Test"]
-            return random.choice(edge_cases)
-            
+            return ["", "N/A", "Other", "Unknown", "Test"]
+        
         elif field_type == "date":
-            start_date = field_metadata.get("start", "2020-01-01")
-            end_date = field_metadata.get("end", "2025-01-01")
-            start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-            end_dt = datetime.strptime(end_date, "%Y-%m-%d")
-            
-            edge_cases = [
-                start_dt - timedelta(days=1),
-                end_dt + timedelta(days=1),
-                datetime(1900, 1, 1),
-                datetime(2100, 12, 31)
-            ]
-            return random.choice(edge_cases)
-            
-        return None
+            start_dt = datetime.strptime(field_metadata.get("start", "2020-01-01"), "%Y-%m-%d")
+            end_dt = datetime.strptime(field_metadata.get("end", "2025-01-01"), "%Y-%m-%d")
+            return [start_dt - timedelta(days=1), end_dt + timedelta(days=1),
+                    datetime(1900, 1, 1), datetime(2100, 12, 31)]
+        
+        return []
     
-    def apply_noise(self, value: float, field_metadata: Dict[str, Any]) -> float:
-        """Apply controlled noise to numeric values."""
+    def inject_edge_case(self, field_type: str, field_metadata: Dict[str, Any]) -> Any:
+        """Inject edge cases for robustness testing."""
+        if not self.inject_edge_cases or self.random.random() > self.edge_case_probability:
+            return None
+        
+        # Edge values (and their parsed dates) are built once per distinct field definition.
+        key = (field_type, json.dumps(field_metadata, sort_keys=True, default=str))
+        edge_cases = self._edge_case_cache.get(key)
+        if edge_cases is None:
+            edge_cases = self._edge_case_cache[key] = tuple(self._edge_case_values(field_type, field_metadata))
+        if not edge_cases:
+            return None
+        
+        return self.random.choice(edge_cases)
+    
+    def _apply_noise(self, value: Any, precision: int) -> Any:
         if not self.inject_noise or not isinstance(value, (int, float)):
             return value
-            
-        noise_factor = random.uniform(-self.noise_range, self.noise_range)
-        precision = field_metadata.get("precision", 2)
-        noisy_value = value * (1 + noise_factor)
         
-        return round(noisy_value, precision)
+        noise_factor = self.random.uniform(-self.noise_range, self.noise_range)
+        return round(value * (1 + noise_factor), precision)
     
-    def generate_field_value(self, field_metadata: Dict[str, Any]) -> Any:
-        field_type = field_metadata.get("type")
-        
-        edge_case = self.inject_edge_case(field_type, field_metadata)
-        if edge_case is not None:
-            return edge_case
-        
-        if field_type == "uuid":
-            return self.fake.uuid4()
+    def apply_noise(self, value: float, field_metadata: Dict[str, Any]) -> float:
+        """Apply controlled noise to numeric values."""
+        return self._apply_noise(value, field_metadata.get("precision", 2))
+    
+    def apply_noise_column(self, column: np.ndarray, precision: int = 2) -> np.ndarray:
+        """Multiply a whole numeric column by per-row noise factors drawn as one array."""
+        noise = self.np_random.uniform(-self.noise_range, self.noise_range, size=len(column))
+        return np.round(column * (1 + noise), precision)
+    
+    def inject_edge_case_column(self, column: np.ndarray, edge_cases: Sequence[Any]) -> np.ndarray:
+        """Overwrite a Bernoulli(edge_case_probability) mask of rows with randomly chosen edge values."""
+        mask = self.np_random.random(len(column)) <= self.edge_case_probability
+        if not mask.any():
+            return column
+        
+        edge_values = np.asarray(edge_cases, dtype=column.dtype if column.dtype.kind == 'M' else None)
+        column = column.astype(np.result_type(column, edge_values), copy=False)
+        column[mask] = edge_values[self.np_random.integers(0, len(edge_values), size=int(mask.sum()))]
+        return column
+    
+    def _perturb_column(self, field: CompiledField, column: np.ndarray) -> np.ndarray:
+        """Apply noise and edge cases to a freshly drawn column, as the per-value path does per cell."""
+        if field.kind in ('integer', 'float') and self.inject_noise:
+            column = self.apply_noise_column(column, field.noise_precision)
         
-        elif field_type == "name":
-            return self.fake.name()
+        if field.edge_cases and self.inject_edge_cases:
+            column = self.inject_edge_case_column(column, field.edge_cases)
         
-        elif field_type == "email":
-            return self.fake.email()
+        return column
+    
+    def compile_field(self, field_metadata: Dict[str, Any], field_name: str = "") -> CompiledField:
+        """Resolve a field's defaults, bounds, options and edge cases into a pre-bound generator."""
+        field_type = field_metadata.get("type")
+        edge_cases = tuple(self._edge_case_values(field_type, field_metadata))
+        noise_precision = field_metadata.get("precision", 2)
         
-        elif field_type == "phone":
-            return self.fake.phone_number()
+        if field_type in self.INTEGER_TYPES:
+            default_min, default_max = self.INTEGER_TYPES[field_type]
+            low = field_metadata.get("min", default_min)
+            high = field_metadata.get("max", default_max)
+            
+            def value(gen):
+                return gen.random.randint(low, high)
+            
+            return CompiledField(field_name, field_type, 'integer', value, low=low, high=high,
+                                 noise_precision=noise_precision, edge_cases=edge_cases)
+        
+        elif field_type in self.FLOAT_TYPES:
+            default_min, default_max, default_precision = self.FLOAT_TYPES[field_type]
+            low = field_metadata.get("min", default_min)
+            high = field_metadata.get("max", default_max)
+            precision = field_metadata.get("precision", default_precision)
+            
+            def value(gen):
+                return round(gen.random.uniform(low, high), precision)
+            
+            return CompiledField(field_name, field_type, 'float', value, low=low, high=high, precision=precision,
+                                 noise_precision=noise_precision, edge_cases=edge_cases)
         
-        elif field_type == "address":
-            return self.fake.address().replace("\n", ", ")
+        elif field_type == "choice":
+            options = tuple(field_metadata.get("options", []))
+            if not options:
+                raise ValueError("Choice field must have 'options' list")
+            
+            def value(gen):
+                return gen.random.choice(options)
+            
+            return CompiledField(field_name, field_type, 'choice', value, options=options, edge_cases=edge_cases)
         
-        elif field_type == "integer":
-            min_val = field_metadata.get("min", 1)
-            max_val = field_metadata.get("max", 100)
-            value = random.randint(min_val, max_val)
-            return self.apply_noise(value, field_metadata)
+        elif field_type in self.CHOICE_ALIASES:
+            options_attr = self.CHOICE_ALIASES[field_type]
+            
+            def value(gen):
+                return gen.random.choice(getattr(gen, options_attr))
+            
+            return CompiledField(field_name, field_type, 'choice', value, options_attr=options_attr)
         
-        elif field_type == "float":
-            min_val = field_metadata.get("min", 0.0)
-            max_val = field_metadata.get("max", 1000.0)
-            precision = field_metadata.get("precision", 2)
-            value = round(random.uniform(min_val, max_val), precision)
-            return self.apply_noise(value, field_metadata)
+        elif field_type == "boolean":
+            def value(gen):
+                return gen.random.choice((True, False))
+            
+            return CompiledField(field_name, field_type, 'boolean', value)
         
         elif field_type == "date":
-            start_date = field_metadata.get("start", "2020-01-01")
-            end_date = field_metadata.get("end", "2025-01-01")
+            start_dt = datetime.strptime(field_metadata.get("start", "2020-01-01"), "%Y-%m-%d")
+            end_dt = datetime.strptime(field_metadata.get("end", "2025-01-01"), "%Y-%m-%d")
             
-            start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-            end_dt = datetime.strptime(end_date, "%Y-%m-%d")
+            def value(gen):
+                return gen.fake.date_between(start_date=start_dt, end_date=end_dt)
             
-            return self.fake.date_between(start_date=start_dt, end_date=end_dt)
+            return CompiledField(field_name, field_type, 'date', value, low=np.datetime64(start_dt.date(), 'D'),
+                                 high=np.datetime64(end_dt.date(), 'D'), edge_cases=edge_cases)
         
-        elif field_type == "choice":
-            options = field_metadata.get("options", [])
-            if not options:
-                raise ValueError("Choice field must have 'options' list")
-            return random.choice(options)
+        elif field_type == "uuid":
+            def value(gen):
+                return gen.fake.uuid4()
+            
+            return CompiledField(field_name, field_type, 'uuid', value, unique=bool(field_metadata.get("unique", False)))
         
-        elif field_type == "company":
-            return self.fake.company()
+        elif field_type == "address":
+            def value(gen):
+                return gen.fake.address().replace("\n", ", ")
         
         elif field_type == "text":
             max_chars = field_metadata.get("max_chars", 200)
-            return self.fake.text(max_nb_chars=max_chars)
+            
+            def value(gen):
+                return gen.fake.text(max_nb_chars=max_chars)
         
-        elif field_type == "city":
-            return self.fake.city()
+        elif field_type in FAKER_PROVIDERS:
+            provider = FAKER_PROVIDERS[field_type]
+            
+            def value(gen):
+                return getattr(gen.fake, provider)()
+        
+        else:
+            raise ValueError(f"Unknown field type: {field_type}")
         
-        elif field_type == "state":
-            return self.fake.state()
+        pool_enabled, pool = self._parse_pool_config(field_type, field_metadata.get("pool"))
+        return CompiledField(field_name, field_type, 'faker', value, edge_cases=edge_cases,
+                             pool=pool, pool_enabled=pool_enabled)
+    
+    def _parse_pool_config(self, field_type: str, pool: Any) -> Tuple[Optional[bool], Optional[PoolConfig]]:
+        """Normalize a field's "pool" metadata: true/false, or {"size", "unique", "max_bytes"}."""
+        if pool is None:
+            return None, None
         
-        elif field_type == "country":
-            return self.fake.country()
+        if field_type not in POOLABLE_TYPES:
+            raise ValueError(f"Field type '{field_type}' does not support value pools")
         
-        elif field_type == "zipcode":
-            return self.fake.zipcode()
+        if isinstance(pool, bool):
+            return pool, None
         
-        elif field_type == "boolean":
-            return random.choice([True, False])
-        
-        elif field_type == "gender":
-            return random.choice(self.genders)
-        
-        elif field_type == "transaction":
-            min_val = field_metadata.get("min", 10.0)
-            max_val = field_metadata.get("max", 10000.0)
-            precision = field_metadata.get("precision", 2)
-            value = round(random.uniform(min_val, max_val), precision)
-            return self.apply_noise(value, field_metadata)
-        
-        elif field_type == "age":
-            min_val = field_metadata.get("min", 18)
-            max_val = field_metadata.get("max", 85)
-            value = random.randint(min_val, max_val)
-            return self.apply_noise(value, field_metadata)
-        
-        elif field_type == "salary":
-            min_val = field_metadata.get("min", 30000)
-            max_val = field_metadata.get("max", 150000)
-            value = random.randint(min_val, max_val)
-            return self.apply_noise(value, field_metadata)
-        
-        elif field_type == "transaction_type":
-            return random.choice(self.transaction_types)
-        
-        elif field_type == "product_category":
-            return random.choice(self.product_categories)
-        
-        elif field_type == "currency":
-            return random.choice(self.currencies)
-        
-        elif field_type == "employment_status":
-            return random.choice(self.employment_status)
-        
-        elif field_type == "education":
-            return random.choice(self.education_levels)
-        
-        elif field_type == "credit_score":
-            min_val = field_metadata.get("min", 300)
-            max_val = field_metadata.get("max", 850)
-            value = random.randint(min_val, max_val)
-            return self.apply_noise(value, field_metadata)
-        
-        elif field_type == "account_balance":
-            min_val = field_metadata.get("min", -5000.0)
-            max_val = field_metadata.get("max", 50000.0)
-            precision = field_metadata.get("precision", 2)
-            value = round(random.uniform(min_val, max_val), precision)
-            return self.apply_noise(value, field_metadata)
-        
-        elif field_type == "price":
-            min_val = field_metadata.get("min", 1.0)
-            max_val = field_metadata.get("max", 1000.0)
-            precision = field_metadata.get("precision", 2)
-            value = round(random.uniform(min_val, max_val), precision)
-            return self.apply_noise(value, field_metadata)
+        if not isinstance(pool, dict):
+            raise ValueError("'pool' must be a boolean or an object")
         
-        elif field_type == "quantity":
-            min_val = field_metadata.get("min", 1)
-            max_val = field_metadata.get("max", 100)
-            value = random.randint(min_val, max_val)
-            return self.apply_noise(value, field_metadata)
+        config = PoolConfig(size=pool.get("size"), unique=pool.get("unique", False), max_bytes=pool.get("max_bytes"))
+        if config.size is not None and config.size < 1:
+            raise ValueError("Pool size must be a positive integer")
+        
+        return pool.get("enabled", True), config
+    
+    def _compile(self, schema: Dict) -> Tuple[Tuple[CompiledField, ...], List[Dict]]:
+        if isinstance(schema, dict) and 'tables' in schema:
+            raise ValueError("Multi-table schemas describe several tables; generate them with "
+                             "relational.generate_tables or relational.generate_relational")
+        
+        fingerprint = schema_fingerprint(schema)
+        
+        compiled = _PLAN_CACHE.get(fingerprint)
+        if compiled is not None:
+            _PLAN_CACHE.move_to_end(fingerprint)
+            return compiled
+        
+        fields = []
+        for field_name, field_metadata in schema.get('fields', {}).items():
+            try:
+                fields.append(self.compile_field(field_metadata, field_name))
+            except Exception as e:
+                raise ValueError(f"Error generating field '{field_name}': {str(e)}")
+        
+        compiled = (tuple(fields), compile_rules(schema))
+        _PLAN_CACHE[fingerprint] = compiled
+        if len(_PLAN_CACHE) > PLAN_CACHE_SIZE:
+            _PLAN_CACHE.popitem(last=False)
+        
+        return compiled
+    
+    def compile_schema(self, schema: Dict) -> Tuple[CompiledField, ...]:
+        """Compile a schema into a generation plan, reusing cached plans for identical schemas."""
+        return self._compile(schema)[0]
+    
+    def compile_rules(self, schema: Dict) -> List[Dict]:
+        """Built-in and schema-declared cross-field rules, compiled once per schema."""
+        return self._compile(schema)[1]
+    
+    def _pool_path(self, field_type: str, config: PoolConfig) -> str:
+        seed = self.seed if self.seed is not None else 'unseeded'
+        locale = '-'.join(self.fake.locales)
+        uniqueness = 'unique' if config.unique else 'any'
+        return os.path.join(self.pool_dir, f"{field_type}_{locale}_{config.size}_{uniqueness}_{config.max_bytes}_{seed}.json")
+    
+    def _build_pool(self, field: CompiledField, config: PoolConfig) -> np.ndarray:
+        """Draw up to config.size values from the field's provider, honoring uniqueness and the memory budget."""
+        values = []
+        seen = set()
+        total_bytes = 0
+        max_attempts = config.size * 10 if config.unique else config.size
+        
+        # Seeded pools come from their own Faker stream so that loading a persisted pool
+        # instead of building it leaves the rest of the generated data unchanged.
+        faker_state = self.fake.random.getstate()
+        if self.seed is not None:
+            self.fake.random.seed(f"{self.seed}:{field.type}:{config}")
+        
+        try:
+            for _ in range(max_attempts):
+                if len(values) >= config.size:
+                    break
+                
+                value = field.value(self)
+                if config.unique:
+                    if value in seen:
+                        continue
+                    seen.add(value)
+                
+                total_bytes += sys.getsizeof(value)
+                if config.max_bytes is not None and total_bytes > config.max_bytes:
+                    break
+                values.append(value)
+        finally:
+            self.fake.random.setstate(faker_state)
+        
+        if not values:
+            raise ValueError(f"Value pool for '{field.type}' is empty; increase its max_bytes")
+        
+        return np.asarray(values, dtype=object)
+    
+    def value_pool(self, field: CompiledField) -> Optional[np.ndarray]:
+        """Return the pre-generated value pool for a field, or None if the field is not pooled."""
+        if field.type not in POOLABLE_TYPES or field.pool_enabled is False:
+            return None
+        if field.pool_enabled is None and not self.use_pools:
+            return None
+        
+        config = field.pool or PoolConfig()
+        config = PoolConfig(config.size or self.pool_size, config.unique, config.max_bytes)
+        key = (field.type, config)
         
-        elif field_type == "rating":
-            min_val = field_metadata.get("min", 1.0)
-            max_val = field_metadata.get("max", 5.0)
-            precision = field_metadata.get("precision", 1)
-            value = round(random.uniform(min_val, max_val), precision)
-            return self.apply_noise(value, field_metadata)
+        pool = self._pools.get(key)
+        if pool is not None:
+            return pool
         
+        path = self._pool_path(field.type, config) if self.pool_dir else None
+        if path and os.path.exists(path):
+            with open(path, 'r') as f:
+                pool = np.asarray(json.load(f), dtype=object)
         else:
-            raise ValueError(f"Unknown field type: {field_type}")
+            pool = self._build_pool(field, config)
+            if path:
+                os.makedirs(self.pool_dir, exist_ok=True)
+                with open(path, 'w') as f:
+                    json.dump(pool.tolist(), f)
+        
+        self._pools[key] = pool
+        return pool
+    
+    def _field_pools(self, plan: Tuple[CompiledField, ...]) -> Dict[str, np.ndarray]:
+        pools = {}
+        for field in plan:
+            try:
+                pool = self.value_pool(field)
+            except Exception as e:
+                raise ValueError(f"Error generating field '{field.name}': {str(e)}")
+            if pool is not None:
+                pools[field.name] = pool
+        return pools
     
-    def validate_cross_field_consistency(self, row: Dict, schema: Dict) -> List[str]:
-        """Validate cross-field consistency rules."""
-        issues = []
-        fields = schema.get('fields', {})
+    def _generate_raw_value(self, field: CompiledField, pool: Optional[np.ndarray] = None) -> Any:
+        if pool is not None:
+            return pool[self.random.randrange(len(pool))]
         
-        if 'admit_date' in row and 'discharge_date' in row:
-            if pd.notna(row['admit_date']) and pd.notna(row['discharge_date']):
-                if row['discharge_date'] < row['admit_date']:
-                    issues.append("Discharge date before admit date")
+        return field.value(self)
+    
+    def _generate_compiled_value(self, field: CompiledField, pool: Optional[np.ndarray] = None) -> Any:
+        if field.edge_cases and self.inject_edge_cases and self.random.random() <= self.edge_case_probability:
+            return self.random.choice(field.edge_cases)
+        
+        value = self._generate_raw_value(field, pool)
+        if field.kind in ('integer', 'float'):
+            value = self._apply_noise(value, field.noise_precision)
+        return value
+    
+    def generate_field_value(self, field_metadata: Dict[str, Any]) -> Any:
+        field = self.compile_field(field_metadata)
+        return self._generate_compiled_value(field)
+    
+    def _uuid_column_key(self, salt: str) -> Tuple[np.uint64, np.uint64]:
+        """Full 62-bit odd multiplier and offset for one unique UUID column, derived from uuid_key and the salt."""
+        cache_key = (self.uuid_key, salt)
+        keys = self._uuid_keys.get(cache_key)
+        if keys is None:
+            state = np.random.SeedSequence([self.uuid_key, zlib.crc32(salt.encode('utf-8'))]).generate_state(2, np.uint64)
+            mask = np.uint64(_UUID_INDEX_MASK)
+            keys = self._uuid_keys[cache_key] = ((state[0] & mask) | np.uint64(1), state[1] & mask)
+        return keys
+    
+    def generate_uuids(self, num_rows: int, unique: bool = False, start: int = 0, salt: str = "") -> np.ndarray:
+        """Generate num_rows version-4 UUID strings from one random buffer.
+        
+        In unique mode the low 62 bits encode a keyed bijection of the global row index
+        (start + i), so values never repeat within a column, even across chunks and shards.
+        """
+        raw = np.frombuffer(self.np_random.bytes(16 * num_rows), dtype=np.uint8).reshape(num_rows, 16).copy()
+        
+        if unique:
+            multiplier, key = self._uuid_column_key(salt)
+            mask = np.uint64(_UUID_INDEX_MASK)
+            with np.errstate(over='ignore'):
+                mixed = (np.arange(start, start + num_rows, dtype=np.uint64) * multiplier + key) & mask
+                mixed ^= mixed >> np.uint64(31)
+            raw[:, 8:] = mixed.astype('>u8').view(np.uint8).reshape(num_rows, 8)
+        
+        raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40
+        raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80
+        return format_uuids(raw)
+    
+    def _generate_date_column(self, field: CompiledField, num_rows: int) -> np.ndarray:
+        """Draw day offsets within the field's pre-parsed bounds as one datetime64[D] array."""
+        span = int((field.high - field.low) // np.timedelta64(1, 'D'))
+        return field.low + self.np_random.integers(0, span, size=num_rows, endpoint=True)
+    
+    def _choice_categories(self, field: CompiledField) -> Tuple[pd.CategoricalDtype, np.ndarray, np.ndarray]:
+        """Categories for a choice field plus the category codes of its options and edge cases."""
+        options = list(field.options or getattr(self, field.options_attr))
+        edge_cases = list(field.edge_cases) if self.inject_edge_cases else []
+        # Options may repeat (to weight them); categories must not.
+        categories = pd.Index(list(dict.fromkeys(options + edge_cases)))
+        return (pd.CategoricalDtype(categories), categories.get_indexer(options),
+                categories.get_indexer(edge_cases))
+    
+    def _generate_choice_column(self, field: CompiledField, num_rows: int) -> Any:
+        rng = self.np_random
+        dtype, option_codes, edge_codes = self._choice_categories(field)
+        codes = option_codes[rng.integers(0, len(option_codes), size=num_rows)]
+        
+        if len(edge_codes):
+            mask = rng.random(num_rows) <= self.edge_case_probability
+            if mask.any():
+                codes[mask] = edge_codes[rng.integers(0, len(edge_codes), size=int(mask.sum()))]
+        
+        if self.categorical:
+            return pd.Categorical.from_codes(codes, dtype=dtype)
+        return np.asarray(dtype.categories, dtype=object)[codes]
+    
+    def _generate_compiled_column(self, field: CompiledField, num_rows: int, pool: Optional[np.ndarray] = None,
+                                  start: int = 0) -> Any:
+        rng = self.np_random
+        
+        if field.kind == 'uuid':
+            return self.generate_uuids(num_rows, unique=field.unique, start=start, salt=field.name)
+        
+        if field.kind == 'integer':
+            column = rng.integers(field.low, field.high, size=num_rows, endpoint=True)
+        
+        elif field.kind == 'float':
+            column = np.round(rng.uniform(field.low, field.high, size=num_rows), field.precision)
+        
+        elif field.kind == 'choice':
+            # Edge cases are drawn as category codes too, so the column is returned directly.
+            return self._generate_choice_column(field, num_rows)
         
-        if 'order_date' in row and 'shipping_date' in row:
-            if pd.notna(row['order_date']) and pd.notna(row['shipping_date']):
-                if row['shipping_date'] < row['order_date']:
-                    issues.append("Shipping date before order date")
+        elif field.kind == 'boolean':
+            column = rng.integers(0, 2, size=num_rows).astype(bool)
         
-        if 'age' in row:
-            if pd.notna(row['age']) and (row['age'] < 0 or row['age'] > 120):
-                issues.append("Age out of reasonable range")
+        elif field.kind == 'date':
+            column = self._generate_date_column(field, num_rows)
         
-        if 'credit_score' in row:
-            if pd.notna(row['credit_score']) and (row['credit_score'] < 300 or row['credit_score'] > 850):
-                issues.append("Credit score out of valid range")
+        elif pool is not None:
+            column = pool[rng.integers(0, len(pool), size=num_rows)]
         
-        return issues
+        else:
+            column = np.empty(num_rows, dtype=object)
+            column[:] = [field.value(self) for _ in range(num_rows)]
+        
+        return self._perturb_column(field, column)
     
-    def generate_data(self, schema: Dict, num_rows: int) -> pd.DataFrame:
-        data = []
-        fields = schema.get('fields', {})
-        consistency_issues = []
+    def generate_column(self, field_metadata: Dict[str, Any], num_rows: int) -> Any:
+        """Generate a whole column at once, drawing numeric/choice/boolean/date fields as one array."""
+        field = self.compile_field(field_metadata)
+        return self._generate_compiled_column(field, num_rows)
+    
+    def _generate_columnar_chunk(self, plan: Tuple[CompiledField, ...], start: int, stop: int,
+                                 profile: Optional[GenerationProfile] = None) -> pd.DataFrame:
+        num_rows = stop - start
+        with _stage(profile, 'pools'):
+            pools = self._field_pools(plan)
+        columns = {}
+        
+        for field in plan:
+            began = time.perf_counter()
+            try:
+                columns[field.name] = self._generate_compiled_column(field, num_rows, pools.get(field.name), start)
+            except Exception as e:
+                raise ValueError(f"Error generating field '{field.name}': {str(e)}")
+            if profile is not None:
+                profile.record_field(field.name, field.type, time.perf_counter() - began, num_rows,
+                                     column_nbytes(columns[field.name]))
+        
+        with _stage(profile, 'assembly'):
+            df = pd.DataFrame(columns, index=pd.RangeIndex(start, stop))
         
-        for row_idx in range(num_rows):
-            row = {}
-            row_issues = []
-            
-            for field_name, field_metadata in fields.items():
+        return df
+    
+    def _generate_row_chunk(self, plan: Tuple[CompiledField, ...], start: int, stop: int,
+                            profile: Optional[GenerationProfile] = None) -> pd.DataFrame:
+        num_rows = stop - start
+        with _stage(profile, 'pools'):
+            pools = self._field_pools(plan)
+        seconds = dict.fromkeys((field.name for field in plan), 0.0)
+        
+        # UUID, date and pooled columns are drawn in bulk; every other field is drawn value by value, row by row.
+        columns = {}
+        for field in plan:
+            began = time.perf_counter()
+            pool = pools.get(field.name)
+            if field.kind == 'uuid':
+                columns[field.name] = self.generate_uuids(num_rows, unique=field.unique, start=start, salt=field.name)
+            elif field.kind == 'date':
+                columns[field.name] = self._generate_date_column(field, num_rows)
+            elif pool is not None:
+                columns[field.name] = pool[self.np_random.integers(0, len(pool), size=num_rows)]
+            seconds[field.name] += time.perf_counter() - began
+        row_fields = [field for field in plan if field.name not in columns]
+        values = {field.name: [] for field in row_fields}
+        
+        for _ in range(num_rows):
+            for field in row_fields:
                 try:
-                    row[field_name] = self.generate_field_value(field_metadata)
+                    if profile is None:
+                        values[field.name].append(field.value(self))
+                    else:
+                        began = time.perf_counter()
+                        values[field.name].append(field.value(self))
+                        seconds[field.name] += time.perf_counter() - began
                 except Exception as e:
-                    raise ValueError(f"Error generating field '{field_name}': {str(e)}")
+                    raise ValueError(f"Error generating field '{field.name}': {str(e)}")
+        
+        # Noise and edge cases are applied per column with masks rather than per cell.
+        for field in plan:
+            began = time.perf_counter()
+            column = columns.get(field.name)
+            if column is None:
+                column = np.empty(num_rows, dtype=object)
+                column[:] = values[field.name]
+                if field.kind in ('integer', 'float', 'boolean'):
+                    column = column.astype(type(column[0]) if num_rows else float)
+            columns[field.name] = self._perturb_column(field, column)
+            
+            if profile is not None:
+                calls = num_rows if field.name in values else 1
+                profile.record_field(field.name, field.type, seconds[field.name] + time.perf_counter() - began,
+                                     num_rows, column_nbytes(columns[field.name]), calls)
+        
+        with _stage(profile, 'assembly'):
+            df = pd.DataFrame(columns, columns=[field.name for field in plan], index=pd.RangeIndex(start, stop))
+            for field in plan:
+                if field.kind == 'date':
+                    df[field.name] = df[field.name].astype('datetime64[s]')
+                elif field.kind == 'choice' and self.categorical:
+                    df[field.name] = pd.Categorical(df[field.name], dtype=self._choice_categories(field)[0])
+        
+        return df
+    
+    def _resample_violations(self, df: pd.DataFrame, plan: Tuple[CompiledField, ...], rules: List[Dict], start: int):
+        """Redraw the fields of rows breaking "resample" rules until they pass or attempts run out."""
+        fields = {field.name: field for field in plan}
+        pools = self._field_pools(plan)
+        rules = [rule for rule in applicable_rules(df, rules) if rule['on_violation'] == 'resample']
+        
+        for _ in range(MAX_RESAMPLE_ATTEMPTS):
+            resampled = False
             
-            issues = self.validate_cross_field_consistency(row, schema)
-            if issues:
-                row_issues.extend(issues)
-                consistency_issues.append({
-                    'row': row_idx,
-                    'issues': issues
-                })
+            for rule in rules:
+                rows = np.flatnonzero(rule_mask(df, rule))
+                if not len(rows):
+                    continue
+                
+                resampled = True
+                for name in rule['fields']:
+                    values = self._generate_compiled_column(fields[name], len(rows), pools.get(name), start)
+                    df.iloc[rows, df.columns.get_loc(name)] = values
             
-            data.append(row)
+            if not resampled:
+                break
+    
+    def _generate_chunk(self, plan: Tuple[CompiledField, ...], schema: Dict, start: int,
+                        stop: int) -> Tuple[pd.DataFrame, int, Optional[GenerationProfile]]:
+        profile = GenerationProfile() if self.profile is not None else None
+        if self.columnar:
+            df = self._generate_columnar_chunk(plan, start, stop, profile)
+        else:
+            df = self._generate_row_chunk(plan, start, stop, profile)
         
-        df = pd.DataFrame(data)
+        with _stage(profile, 'consistency'):
+            rules = self.compile_rules(schema)
+            self._resample_violations(df, plan, rules, start)
+            issue_count = count_inconsistent_rows(df, rules)
         
-        if consistency_issues:
-            print(f"Warning: {len(consistency_issues)} rows have consistency issues")
+        if profile is not None:
+            profile.rows = len(df)
+        return df, issue_count, profile
+    
+    def _shard_config(self) -> Dict[str, Any]:
+        """Settings a worker process needs to rebuild an equivalent generator."""
+        config = {
+            'init': {
+                'inject_edge_cases': self.inject_edge_cases,
+                'inject_noise': self.inject_noise,
+                'noise_range': self.noise_range,
+                'columnar': self.columnar,
+                'use_pools': self.use_pools,
+                'pool_size': self.pool_size,
+                'pool_dir': self.pool_dir,
+                'categorical': self.categorical,
+                'profile': self.profile is not None,
+                'locale': self.locale,
+            },
+            'attributes': {
+                'edge_case_probability': self.edge_case_probability,
+                'uuid_key': self.uuid_key,
+                '_pools': self._pools,
+            },
+        }
+        for options_attr in self.CHOICE_ALIASES.values():
+            config['attributes'][options_attr] = getattr(self, options_attr)
+        return config
+    
+    def _generate_parallel_chunks(self, schema: Dict, num_rows: int,
+                                  chunk_size: int) -> Iterator[Tuple[pd.DataFrame, int, Optional[GenerationProfile]]]:
+        """Generate chunks in a process pool, each seeded from the generator's shard seed sequence so output is reproducible."""
+        ranges = [(start, min(start + chunk_size, num_rows)) for start in range(0, num_rows, chunk_size)]
+        seeds = [int(child.generate_state(1)[0]) for child in self._shard_seeds.spawn(len(ranges))]
+        # Build value pools once here so every shard samples from the same pools.
+        self._field_pools(self.compile_schema(schema))
+        config = self._shard_config()
+        
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            pending = deque()
+            for (start, stop), shard_seed in zip(ranges, seeds):
+                pending.append(executor.submit(_generate_shard, config, schema, start, stop, shard_seed))
+                # Bound the number of finished-but-unconsumed chunks held in memory.
+                if len(pending) >= 2 * self.workers:
+                    yield pending.popleft().result()
+            
+            while pending:
+                yield pending.popleft().result()
+    
+    def subscribe(self, callback: Callable[[pd.DataFrame], None]):
+        """Call callback with each chunk generate_chunks/generate_data produces, in row order."""
+        self.subscribers.append(callback)
+    
+    def unsubscribe(self, callback: Callable[[pd.DataFrame], None]):
+        self.subscribers.remove(callback)
+    
+    def add_profile_hook(self, callback: Callable[[Dict[str, Any]], None]):
+        """Call callback with each completed run's GenerationProfile report; needs profile=True."""
+        if self.profile is None:
+            raise ValueError("Profile hooks need a generator created with profile=True")
+        self.profile_hooks.append(callback)
+    
+    def remove_profile_hook(self, callback: Callable[[Dict[str, Any]], None]):
+        self.profile_hooks.remove(callback)
+    
+    def generate_chunks(self, schema: Dict, num_rows: int, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+        """Yield the dataset as DataFrames of at most chunk_size rows so memory stays bounded by the chunk."""
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer")
         
-        return df
+        plan = self.compile_schema(schema)
+        issue_count = 0
+        run_profile = GenerationProfile() if self.profile is not None else None
+        
+        if self.workers > 1:
+            results = self._generate_parallel_chunks(schema, num_rows, chunk_size)
+        else:
+            results = (self._generate_chunk(plan, schema, start, min(start + chunk_size, num_rows))
+                       for start in range(0, num_rows, chunk_size))
+        
+        for chunk, chunk_issues, chunk_profile in results:
+            issue_count += chunk_issues
+            if chunk_profile is not None:
+                run_profile.merge(chunk_profile)
+            with _stage(run_profile, 'subscribers'):
+                for callback in self.subscribers:
+                    callback(chunk)
+            yield chunk
+        
+        if issue_count:
+            print(f"Warning: {issue_count} rows have consistency issues")
+        
+        if run_profile is not None:
+            self.profile.merge(run_profile)
+            report = run_profile.report()
+            for callback in self.profile_hooks:
+                callback(report)
+    
+    def generate_data(self, schema: Dict, num_rows: int, chunk_size: int = DEFAULT_CHUNK_SIZE) -> pd.DataFrame:
+        if self.workers > 1:
+            # Split into at least one shard per worker; shard boundaries depend only on
+            # (workers, num_rows, chunk_size), which keeps seeded output reproducible.
+            chunk_size = max(1, min(chunk_size, -(-num_rows // self.workers)))
+        
+        chunks = list(self.generate_chunks(schema, num_rows, chunk_size))
+        
+        if not chunks:
+            return pd.DataFrame(columns=[field.name for field in self.compile_schema(schema)])
+        
+        if len(chunks) == 1:
+            return chunks[0]
+        
+        return pd.concat(chunks)
     
     def validate_schema(self, schema: Dict) -> bool:
         if not isinstance(schema, dict):
@@ -318,5 +891,75 @@ class SyntheticDataGenerator:
             elif field_type == 'date':
                 if 'start' not in field_metadata or 'end' not in field_metadata:
                     return False
+            
+            if 'pool' in field_metadata:
+                if field_type not in POOLABLE_TYPES or not isinstance(field_metadata['pool'], (bool, dict)):
+                    return False
         
-        return True 
\ No newline at end of file
+        try:
+            compile_rules(schema)
+        except ValueError:
+            return False
+        
+        return True
+
+def _generate_shard(config: Dict[str, Any], schema: Dict, start: int, stop: int,
+                    seed: int) -> Tuple[pd.DataFrame, int, Optional[GenerationProfile]]:
+    """Process-pool entry point: generate rows [start, stop) with an independently seeded generator."""
+    generator = SyntheticDataGenerator(seed=seed, **config['init'])
+    for attribute, value in config['attributes'].items():
+        setattr(generator, attribute, value)
+    
+    plan = generator.compile_schema(schema)
+    return generator._generate_chunk(plan, schema, start, stop)
+
+class GeneratorPool:
+    """Reusable generators keyed by configuration, so Faker and compiled plans are built once per process.
+    
+    acquire() hands out an idle generator with the same settings, or a new one, reseeded for
+    the request; it returns to the pool when the with block ends. A generator is never
+    handed to two users at once.
+    """
+    
+    def __init__(self, max_idle: int = GENERATOR_POOL_IDLE):
+        self.max_idle = max_idle
+        self.stats = {'created': 0, 'reused': 0}
+        self._idle: Dict[Tuple[Tuple[str, Any], ...], List[SyntheticDataGenerator]] = {}
+        self._lock = threading.Lock()
+    
+    @contextmanager
+    def acquire(self, seed: Optional[int] = None, **options) -> Iterator[SyntheticDataGenerator]:
+        """A generator configured with options (SyntheticDataGenerator keyword arguments) and seeded with seed."""
+        key = tuple(sorted(options.items()))
+        with self._lock:
+            idle = self._idle.get(key)
+            generator = idle.pop() if idle else None
+            self.stats['reused' if generator is not None else 'created'] += 1
+        
+        if generator is None:
+            generator = SyntheticDataGenerator(seed=seed, **options)
+        else:
+            generator.reseed(seed)
+        
+        try:
+            yield generator
+        finally:
+            # Per-request state must not leak into the next user.
+            generator.subscribers.clear()
+            generator.profile_hooks.clear()
+            if generator.profile is not None:
+                generator.profile.reset()
+            with self._lock:
+                idle = self._idle.setdefault(key, [])
+                if len(idle) < self.max_idle:
+                    idle.append(generator)
+    
+    def clear(self):
+        with self._lock:
+            self._idle.clear()
+
+_GENERATOR_POOL = GeneratorPool()
+
+def get_generator_pool() -> GeneratorPool:
+    """The process-wide generator pool."""
+    return _GENERATOR_POOL
@@ -0,0 +1,116 @@
+"""Opt-in timing of generation work per field, per field type and per stage.
+
+Enable with SyntheticDataGenerator(profile=True); the generator then keeps a cumulative
+GenerationProfile in generator.profile and passes each run's report to its profile hooks.
+"""
+import sys
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator
+import numpy as np
+import pandas as pd
+
+def column_nbytes(column: Any) -> int:
+    """Memory held by a generated column, counting the Python objects of object arrays."""
+    if isinstance(column, pd.Categorical):
+        return int(column.codes.nbytes + column.categories.memory_usage(deep=True))
+    
+    column = np.asarray(column)
+    if column.dtype == object:
+        return int(column.nbytes + sum(map(sys.getsizeof, column)))
+    return int(column.nbytes)
+
+class GenerationProfile:
+    """Cumulative wall time, call count, cells and bytes per field, plus time per stage.
+
+    Profiles are mergeable, so worker shards profile their own chunks and the parent adds them up.
+    """
+    
+    def __init__(self):
+        self.fields: Dict[str, Dict[str, Any]] = {}
+        self.stages: Dict[str, Dict[str, float]] = {}
+        self.rows = 0
+    
+    def record_field(self, name: str, field_type: str, seconds: float, cells: int, nbytes: int = 0, calls: int = 1):
+        entry = self.fields.get(name)
+        if entry is None:
+            entry = self.fields[name] = {'type': field_type, 'seconds': 0.0, 'calls': 0, 'cells': 0, 'bytes': 0}
+        entry['seconds'] += seconds
+        entry['calls'] += calls
+        entry['cells'] += cells
+        entry['bytes'] += nbytes
+    
+    def record_stage(self, stage: str, seconds: float, calls: int = 1):
+        entry = self.stages.setdefault(stage, {'seconds': 0.0, 'calls': 0})
+        entry['seconds'] += seconds
+        entry['calls'] += calls
+    
+    @contextmanager
+    def stage(self, stage: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_stage(stage, time.perf_counter() - start)
+    
+    def merge(self, other: "GenerationProfile") -> "GenerationProfile":
+        for name, entry in other.fields.items():
+            self.record_field(name, entry['type'], entry['seconds'], entry['cells'], entry['bytes'], entry['calls'])
+        for stage, entry in other.stages.items():
+            self.record_stage(stage, entry['seconds'], entry['calls'])
+        self.rows += other.rows
+        return self
+    
+    def reset(self):
+        self.fields.clear()
+        self.stages.clear()
+        self.rows = 0
+    
+    @property
+    def total_seconds(self) -> float:
+        return sum(entry['seconds'] for entry in self.fields.values()) + sum(entry['seconds'] for entry in self.stages.values())
+    
+    def report(self) -> Dict[str, Any]:
+        """Plain-dict report: fields and types sorted slowest first, each with µs per cell and share of the total."""
+        total = self.total_seconds
+        
+        def summarize(entry: Dict[str, Any]) -> Dict[str, Any]:
+            summary = dict(entry)
+            summary['us_per_cell'] = entry['seconds'] * 1e6 / entry['cells'] if entry['cells'] else 0.0
+            summary['share'] = entry['seconds'] / total if total else 0.0
+            return summary
+        
+        types: Dict[str, Dict[str, Any]] = {}
+        for entry in self.fields.values():
+            aggregate = types.setdefault(entry['type'], {'fields': 0, 'seconds': 0.0, 'calls': 0, 'cells': 0, 'bytes': 0})
+            aggregate['fields'] += 1
+            for key in ('seconds', 'calls', 'cells', 'bytes'):
+                aggregate[key] += entry[key]
+        
+        def slowest_first(entries: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+            ordered = sorted(entries.items(), key=lambda item: item[1]['seconds'], reverse=True)
+            return {name: summarize(entry) for name, entry in ordered}
+        
+        return {
+            'rows': self.rows,
+            'total_seconds': total,
+            'fields': slowest_first(self.fields),
+            'types': slowest_first(types),
+            'stages': {stage: dict(entry, share=entry['seconds'] / total if total else 0.0)
+                       for stage, entry in self.stages.items()},
+        }
+    
+    def format_report(self, top: int = 10) -> str:
+        """Human-readable summary for logs."""
+        report = self.report()
+        lines = [f"Generated {report['rows']:,} rows in {report['total_seconds']:.3f}s of profiled work"]
+        
+        lines.append("Slowest fields:")
+        for name, entry in list(report['fields'].items())[:top]:
+            lines.append(f"  {name:<28} {entry['type']:<18} {entry['seconds']:>8.3f}s {entry['share']:>6.1%} "
+                         f"{entry['us_per_cell']:>9.2f} µs/cell {entry['bytes'] / 1e6:>9.1f} MB")
+        
+        lines.append("Stages:")
+        for stage, entry in report['stages'].items():
+            lines.append(f"  {stage:<28} {entry['seconds']:>8.3f}s {entry['share']:>6.1%}")
+        return "\n".join(lines)
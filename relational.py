@@ -0,0 +1,242 @@
+"""Multi-table schemas: parent/child tables whose foreign keys are drawn in bulk from the parent's keys.
+
+A schema with "tables" instead of "fields" describes several tables:
+
+    {"tables": {
+        "accounts": {"rows": 1000, "fields": {"account_id": {"type": "uuid"}, ...}},
+        "transactions": {
+            "parent": {"table": "accounts", "key": "account_id",
+                       "cardinality": {"distribution": "poisson", "mean": 25}},
+            "fields": {"transaction_id": {"type": "uuid"}, ...}}}}
+
+Root tables declare "rows". A child table gets a cardinality-distributed number of rows per
+parent row, grouped by parent, and a foreign-key column named after the parent key (or
+"foreign_key") filled from the parent's key array with one searchsorted per chunk.
+"""
+import copy
+import os
+from dataclasses import dataclass, field as dataclass_field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from generator import DEFAULT_CHUNK_SIZE, SyntheticDataGenerator, format_uuids, parse_uuids
+from writers import EXTENSIONS, open_writer
+
+CARDINALITY_DISTRIBUTIONS = ('fixed', 'uniform', 'poisson', 'geometric', 'zipf')
+
+@dataclass(frozen=True)
+class TableSpec:
+    """One table of a multi-table schema, in generation order (parents before children)."""
+    name: str
+    schema: Dict[str, Any]
+    rows: Optional[int] = None
+    parent: Optional[str] = None
+    key: Optional[str] = None
+    foreign_key: Optional[str] = None
+    cardinality: Dict[str, Any] = dataclass_field(default_factory=dict)
+
+def _check_cardinality(table: str, cardinality: Any):
+    if not isinstance(cardinality, dict):
+        raise ValueError(f"Table '{table}': cardinality must be an object")
+    
+    distribution = cardinality.get('distribution', 'fixed')
+    if distribution not in CARDINALITY_DISTRIBUTIONS:
+        raise ValueError(f"Table '{table}': unknown cardinality distribution '{distribution}'; "
+                         f"expected one of {', '.join(CARDINALITY_DISTRIBUTIONS)}")
+    
+    required = {'fixed': ('count',), 'uniform': ('min', 'max'), 'poisson': ('mean',),
+                'geometric': ('mean',), 'zipf': ('a',)}[distribution]
+    for name in required:
+        if not isinstance(cardinality.get(name), (int, float)) or cardinality[name] < 0:
+            raise ValueError(f"Table '{table}': {distribution} cardinality needs a non-negative '{name}'")
+    
+    if distribution == 'zipf' and cardinality['a'] <= 1:
+        raise ValueError(f"Table '{table}': zipf cardinality needs 'a' > 1")
+    if cardinality.get('min', 0) > cardinality.get('max', float('inf')):
+        raise ValueError(f"Table '{table}': cardinality min exceeds max")
+
+def compile_tables(schema: Dict[str, Any], generator: Optional[SyntheticDataGenerator] = None) -> Tuple[TableSpec, ...]:
+    """Validate a multi-table schema and order its tables so every parent precedes its children."""
+    tables = schema.get('tables')
+    if not isinstance(tables, dict) or not tables:
+        raise ValueError("A multi-table schema needs a non-empty 'tables' object")
+    
+    generator = generator or SyntheticDataGenerator()
+    specs = {}
+    for name, table in tables.items():
+        if not isinstance(table, dict) or not generator.validate_schema(table):
+            raise ValueError(f"Invalid schema for table '{name}'")
+        
+        table_schema = {'fields': table['fields'], 'rules': table.get('rules', [])}
+        parent = table.get('parent')
+        if parent is None:
+            rows = table.get('rows')
+            if not isinstance(rows, int) or rows < 0:
+                raise ValueError(f"Root table '{name}' needs a non-negative integer 'rows'")
+            specs[name] = TableSpec(name, table_schema, rows=rows)
+            continue
+        
+        if not isinstance(parent, dict) or parent.get('table') not in tables:
+            raise ValueError(f"Table '{name}' references an unknown parent table")
+        key = parent.get('key')
+        key_field = tables[parent['table']]['fields'].get(key)
+        if not isinstance(key_field, dict) or key_field.get('type') != 'uuid':
+            raise ValueError(f"Key '{key}' of table '{parent['table']}' must be a uuid field")
+        
+        foreign_key = parent.get('foreign_key', key)
+        if foreign_key in table['fields']:
+            raise ValueError(f"Table '{name}' defines its foreign-key column '{foreign_key}' as a field")
+        
+        cardinality = parent.get('cardinality', {'distribution': 'fixed', 'count': 1})
+        _check_cardinality(name, cardinality)
+        specs[name] = TableSpec(name, table_schema, parent=parent['table'], key=key,
+                                foreign_key=foreign_key, cardinality=dict(cardinality))
+    
+    # Key columns are generated unique so every child row points at exactly one parent row.
+    for spec in specs.values():
+        if spec.parent is not None:
+            parent_fields = specs[spec.parent].schema['fields']
+            if not parent_fields[spec.key].get('unique'):
+                parent_fields = copy.deepcopy(parent_fields)
+                parent_fields[spec.key]['unique'] = True
+                specs[spec.parent].schema['fields'] = parent_fields
+    
+    ordered: List[TableSpec] = []
+    placed = set()
+    while len(ordered) < len(specs):
+        ready = [spec for spec in specs.values()
+                 if spec.name not in placed and (spec.parent is None or spec.parent in placed)]
+        if not ready:
+            cyclic = sorted(name for name in specs if name not in placed)
+            raise ValueError(f"Tables have cyclic parent relationships: {', '.join(cyclic)}")
+        for spec in ready:
+            ordered.append(spec)
+            placed.add(spec.name)
+    
+    for spec in ordered:
+        generator.compile_schema(spec.schema)
+        generator.compile_rules(spec.schema)
+    return tuple(ordered)
+
+def draw_cardinalities(rng: np.random.Generator, cardinality: Dict[str, Any], size: int) -> np.ndarray:
+    """Number of child rows for each of size parent rows, drawn as one array."""
+    distribution = cardinality.get('distribution', 'fixed')
+    
+    if distribution == 'fixed':
+        counts = np.full(size, int(cardinality['count']), dtype=np.int64)
+    elif distribution == 'uniform':
+        counts = rng.integers(int(cardinality['min']), int(cardinality['max']), size=size, endpoint=True)
+    elif distribution == 'poisson':
+        counts = rng.poisson(cardinality['mean'], size=size)
+    elif distribution == 'geometric':
+        # Failures before the first success; p = 1 / (mean + 1) gives the requested mean.
+        counts = rng.geometric(1.0 / (cardinality['mean'] + 1.0), size=size) - 1
+    else:
+        counts = rng.zipf(cardinality['a'], size=size)
+    
+    lower = cardinality.get('min', 0)
+    upper = cardinality.get('max')
+    return np.clip(counts, lower, upper).astype(np.int64)
+
+def generate_tables(generator: SyntheticDataGenerator, schema: Dict[str, Any], chunk_size: int = DEFAULT_CHUNK_SIZE,
+                    rows: Optional[Dict[str, int]] = None) -> Iterator[Tuple[str, pd.DataFrame]]:
+    """Yield (table name, chunk) pairs table by table, parents first.
+
+    Only the parent key columns a later table needs are kept in memory, packed to 16 bytes per
+    key, and each is released once its last child table is done; rows overrides the row counts
+    of root tables.
+    """
+    tables = compile_tables(schema, generator)
+    pending_children: Dict[str, int] = {}
+    needed_keys: Dict[str, set] = {}
+    for spec in tables:
+        if spec.parent is not None:
+            pending_children[spec.parent] = pending_children.get(spec.parent, 0) + 1
+            needed_keys.setdefault(spec.parent, set()).add(spec.key)
+    
+    sizes: Dict[str, int] = {}
+    keys: Dict[Tuple[str, str], np.ndarray] = {}
+    
+    for spec in tables:
+        offsets = parent_keys = None
+        if spec.parent is None:
+            num_rows = (rows or {}).get(spec.name, spec.rows)
+        else:
+            offsets = np.cumsum(draw_cardinalities(generator.np_random, spec.cardinality, sizes[spec.parent]))
+            num_rows = int(offsets[-1]) if len(offsets) else 0
+            parent_keys = keys[(spec.parent, spec.key)]
+        sizes[spec.name] = num_rows
+        
+        collected = {key: [] for key in needed_keys.get(spec.name, ())}
+        for chunk in generator.generate_chunks(spec.schema, num_rows, chunk_size):
+            if offsets is not None:
+                # Child row i belongs to the first parent whose cumulative count exceeds i.
+                parents = np.searchsorted(offsets, chunk.index.to_numpy(), side='right')
+                chunk.insert(0, spec.foreign_key, format_uuids(parent_keys[parents]))
+            for key, parts in collected.items():
+                parts.append(parse_uuids(chunk[key].to_numpy(dtype=object)))
+            yield spec.name, chunk
+        
+        for key, parts in collected.items():
+            keys[(spec.name, key)] = np.concatenate(parts) if parts else np.empty((0, 16), dtype=np.uint8)
+        
+        if spec.parent is not None:
+            pending_children[spec.parent] -= 1
+            if not pending_children[spec.parent]:
+                for key in needed_keys[spec.parent]:
+                    keys.pop((spec.parent, key), None)
+
+def _empty_frame(spec: TableSpec) -> pd.DataFrame:
+    columns = ([spec.foreign_key] if spec.parent else []) + list(spec.schema['fields'])
+    return pd.DataFrame(columns=columns)
+
+def generate_relational(generator: SyntheticDataGenerator, schema: Dict[str, Any],
+                        rows: Optional[Dict[str, int]] = None) -> Dict[str, pd.DataFrame]:
+    """Materialize every table of a multi-table schema, each indexed from 0."""
+    chunks: Dict[str, List[pd.DataFrame]] = {}
+    for name, chunk in generate_tables(generator, schema, rows=rows):
+        chunks.setdefault(name, []).append(chunk)
+    
+    frames = {}
+    for spec in compile_tables(schema, generator):
+        parts = chunks.get(spec.name)
+        if not parts:
+            frames[spec.name] = _empty_frame(spec)
+        else:
+            frames[spec.name] = parts[0] if len(parts) == 1 else pd.concat(parts)
+    return frames
+
+def write_tables(generator: SyntheticDataGenerator, schema: Dict[str, Any], output_dir: str,
+                 output_format: str = 'csv', chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 rows: Optional[Dict[str, int]] = None) -> Dict[str, int]:
+    """Stream every table to <output_dir>/<table>.<ext>; returns rows written per table.
+    
+    Tables without rows still get a file (header-only where the format has one).
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    tables = compile_tables(schema, generator)
+    plans = {spec.name: generator.compile_schema(spec.schema) for spec in tables}
+    written = {}
+    writer, current = None, None
+    
+    try:
+        for name, chunk in generate_tables(generator, schema, chunk_size, rows):
+            if name != current:
+                if writer is not None:
+                    writer.close()
+                    written[current] = writer.rows_written
+                path = os.path.join(output_dir, f"{name}{EXTENSIONS[output_format]}")
+                writer, current = open_writer(path, output_format, plans[name]), name
+            writer.write(chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+            written[current] = writer.rows_written
+    
+    for spec in tables:
+        if spec.name not in written:
+            path = os.path.join(output_dir, f"{spec.name}{EXTENSIONS[output_format]}")
+            with open_writer(path, output_format, plans[spec.name]) as writer:
+                writer.write(_empty_frame(spec))
+            written[spec.name] = 0
+    return written
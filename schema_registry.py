@@ -0,0 +1,131 @@
+import json
+import os
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+from generator import CompiledField, SyntheticDataGenerator, schema_fingerprint
+from relational import TableSpec, compile_tables
+
+DEFAULT_DOMAINS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "domains")
+
+@dataclass(frozen=True)
+class DomainSchema:
+    """A loaded, validated and compiled domain schema; treat schema as read-only, it is shared.
+    
+    Multi-table schemas have an empty plan and rules and list their tables instead.
+    """
+    name: str
+    path: str
+    version: Tuple[int, int]
+    schema: Dict[str, Any]
+    plan: Tuple[CompiledField, ...]
+    rules: List[Dict]
+    fingerprint: str
+    tables: Tuple[TableSpec, ...] = ()
+    
+    @property
+    def is_relational(self) -> bool:
+        return bool(self.tables)
+    
+    @property
+    def title(self) -> str:
+        return self.name.replace('_', ' ').title()
+
+class SchemaRegistry:
+    """In-process cache of domain schemas, loaded on first use and reloaded when the file changes."""
+    
+    def __init__(self, domains_dir: str = DEFAULT_DOMAINS_DIR):
+        self.domains_dir = domains_dir
+        self._entries: Dict[str, DomainSchema] = {}
+        self._lock = threading.Lock()
+        self._compiler: Optional[SyntheticDataGenerator] = None
+    
+    def names(self) -> List[str]:
+        """Domain names (file stems) available in the domains directory, without loading them."""
+        if not os.path.isdir(self.domains_dir):
+            return []
+        return sorted(f[:-len('.json')] for f in os.listdir(self.domains_dir) if f.endswith('.json'))
+    
+    def path(self, name: str) -> str:
+        return os.path.join(self.domains_dir, f"{name.lower()}.json")
+    
+    def get(self, name: str) -> DomainSchema:
+        """The schema for a domain name, e.g. "retail" or "Retail"."""
+        path = self.path(name)
+        if not os.path.isfile(path):
+            raise KeyError(f"Unknown domain '{name}'")
+        return self._load(path, name.lower())
+    
+    def schema(self, name: str) -> Dict[str, Any]:
+        return self.get(name).schema
+    
+    def resolve(self, name_or_path: str) -> DomainSchema:
+        """Look up a domain by name, or load a schema file from any path."""
+        if os.path.isfile(name_or_path):
+            name = os.path.splitext(os.path.basename(name_or_path))[0]
+            return self._load(os.path.abspath(name_or_path), name)
+        return self.get(name_or_path)
+    
+    def load_all(self) -> Dict[str, DomainSchema]:
+        return {name: self.get(name) for name in self.names()}
+    
+    def invalidate(self, name: Optional[str] = None):
+        with self._lock:
+            if name is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(os.path.abspath(self.path(name)), None)
+    
+    def _load(self, path: str, name: str) -> DomainSchema:
+        key = os.path.abspath(path)
+        stat = os.stat(key)
+        version = (stat.st_mtime_ns, stat.st_size)
+        
+        entry = self._entries.get(key)
+        if entry is not None and entry.version == version:
+            return entry
+        
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.version == version:
+                return entry
+            
+            with open(key, 'r') as f:
+                schema = json.load(f)
+            
+            if self._compiler is None:
+                self._compiler = SyntheticDataGenerator()
+            
+            if isinstance(schema, dict) and 'tables' in schema:
+                try:
+                    tables = compile_tables(schema, self._compiler)
+                except ValueError as e:
+                    raise ValueError(f"Invalid schema for domain '{name}': {path}: {e}")
+                plan, rules = (), []
+            elif self._compiler.validate_schema(schema):
+                tables = ()
+                plan, rules = self._compiler.compile_schema(schema), self._compiler.compile_rules(schema)
+            else:
+                raise ValueError(f"Invalid schema for domain '{name}': {path}")
+            
+            entry = DomainSchema(
+                name=name,
+                path=key,
+                version=version,
+                schema=schema,
+                plan=plan,
+                rules=rules,
+                fingerprint=schema_fingerprint(schema),
+                tables=tables
+            )
+            self._entries[key] = entry
+            return entry
+
+_REGISTRIES: Dict[str, SchemaRegistry] = {}
+
+def get_registry(domains_dir: str = DEFAULT_DOMAINS_DIR) -> SchemaRegistry:
+    """The shared registry for a domains directory."""
+    key = os.path.abspath(domains_dir)
+    if key not in _REGISTRIES:
+        _REGISTRIES[key] = SchemaRegistry(key)
+    return _REGISTRIES[key]
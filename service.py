@@ -0,0 +1,209 @@
+"""Asyncio generation service: python -m service --port 8080
+
+Keeps warm, reseeded generators in each worker, coalesces concurrent small unseeded
+requests for the same domain into one batched generation and splits the result back, and
+runs all CPU work in an executor so the event loop keeps accepting requests. Needs nothing beyond the standard
+library and the generator's own dependencies.
+"""
+import argparse
+import asyncio
+import sys
+import urllib.parse
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+import pandas as pd
+from generator import get_generator_pool
+from schema_registry import DEFAULT_DOMAINS_DIR, DomainSchema, get_registry
+from writers import WRITERS, to_bytes
+
+# Requests are held this long (seconds) waiting for others to join their batch.
+DEFAULT_BATCH_WINDOW = 0.005
+# Batches flush early at this many rows; larger requests are never batched.
+DEFAULT_MAX_BATCH_ROWS = 10_000
+
+CONTENT_TYPES = {
+    'csv': 'text/csv',
+    'jsonl': 'application/x-ndjson',
+    'parquet': 'application/vnd.apache.parquet',
+    'arrow': 'application/vnd.apache.arrow.file',
+}
+
+def _generate_batch(path: str, num_rows: int, options: Tuple[Tuple[str, Any], ...], seed: Optional[int]) -> pd.DataFrame:
+    """Executor entry point: generate num_rows of a schema file with a warm generator from this worker's pool."""
+    schema = get_registry().resolve(path).schema
+    with get_generator_pool().acquire(seed=seed, **dict(options)) as generator:
+        return generator.generate_data(schema, num_rows)
+
+class GenerationService:
+    """Batched, non-blocking front end to SyntheticDataGenerator; use as an async context manager.
+
+    Unseeded requests smaller than max_batch_rows that arrive for the same domain within
+    batch_window seconds share one generation. Seeded requests always run on their own so
+    their output depends only on the seed, even though they reuse warm generators too.
+    """
+    
+    def __init__(self, domains_dir: str = DEFAULT_DOMAINS_DIR, executor: Optional[Executor] = None,
+                 workers: Optional[int] = None, batch_window: float = DEFAULT_BATCH_WINDOW,
+                 max_batch_rows: int = DEFAULT_MAX_BATCH_ROWS, **generator_options):
+        self.registry = get_registry(domains_dir)
+        self.executor = executor if executor is not None else ProcessPoolExecutor(max_workers=workers)
+        self._owns_executor = executor is None
+        self.batch_window = batch_window
+        self.max_batch_rows = max_batch_rows
+        self.options = tuple(sorted(generator_options.items()))
+        self.stats = {'requests': 0, 'batches': 0, 'rows': 0}
+        self._batches: Dict[str, List[Tuple[int, asyncio.Future]]] = {}
+        self._tasks = set()
+    
+    def _domain(self, domain: str) -> DomainSchema:
+        # Only registry names are served: a request value is never used as a file path.
+        if not isinstance(domain, str) or domain.lower() not in self.registry.names():
+            raise KeyError(f"Unknown domain '{domain}'")
+        
+        entry = self.registry.get(domain)
+        if entry.is_relational:
+            raise ValueError(f"Domain '{domain}' has multiple tables; the service serves single-table domains")
+        return entry
+    
+    async def generate(self, domain: str, num_rows: int, seed: Optional[int] = None) -> pd.DataFrame:
+        """Rows of a registry domain, indexed from 0 like generate_data."""
+        if num_rows < 0:
+            raise ValueError("num_rows must not be negative")
+        
+        path = self._domain(domain).path
+        self.stats['requests'] += 1
+        if seed is not None or num_rows >= self.max_batch_rows:
+            return await self._run(path, num_rows, seed)
+        
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        batch = self._batches.get(path)
+        if batch is None:
+            batch = self._batches[path] = []
+            loop.call_later(self.batch_window, self._flush, path, batch)
+        batch.append((num_rows, future))
+        
+        if sum(rows for rows, _ in batch) >= self.max_batch_rows:
+            self._flush(path, batch)
+        return await future
+    
+    def _flush(self, path: str, batch: List[Tuple[int, asyncio.Future]]):
+        # The timer of a batch that already flushed on size must not flush its successor.
+        if self._batches.get(path) is not batch:
+            return
+        
+        del self._batches[path]
+        task = asyncio.ensure_future(self._run_batch(path, batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    async def _run_batch(self, path: str, batch: List[Tuple[int, asyncio.Future]]):
+        try:
+            df = await self._run(path, sum(rows for rows, _ in batch), None)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        offset = 0
+        for rows, future in batch:
+            if not future.done():
+                future.set_result(df.iloc[offset:offset + rows].reset_index(drop=True))
+            offset += rows
+    
+    async def _run(self, path: str, num_rows: int, seed: Optional[int]) -> pd.DataFrame:
+        self.stats['batches'] += 1
+        self.stats['rows'] += num_rows
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, _generate_batch, path, num_rows, self.options, seed)
+    
+    async def render(self, domain: str, num_rows: int, output_format: str = 'csv', seed: Optional[int] = None) -> bytes:
+        """Generated rows serialized in an output format, with serialization off the event loop too."""
+        if output_format not in WRITERS:
+            raise ValueError(f"Unknown output format '{output_format}'; expected one of {', '.join(WRITERS)}")
+        
+        df = await self.generate(domain, num_rows, seed)
+        plan = self._domain(domain).plan
+        return await asyncio.get_running_loop().run_in_executor(None, to_bytes, df, output_format, plan)
+    
+    async def close(self):
+        """Flush waiting requests, let running batches finish and shut down an executor we created."""
+        for path, batch in list(self._batches.items()):
+            self._flush(path, batch)
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._owns_executor:
+            self.executor.shutdown()
+    
+    async def __aenter__(self) -> "GenerationService":
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.close()
+    
+    async def handle_http(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Minimal HTTP/1.0 handler for GET /generate?domain=retail&rows=100&seed=1&format=csv."""
+        try:
+            request_line = (await reader.readline()).decode('latin-1')
+            while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                pass
+            
+            status, content_type, body = await self._respond(request_line)
+            writer.write(f"HTTP/1.0 {status}\r\nContent-Type: {content_type}\r\n"
+                         f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode('latin-1') + body)
+            await writer.drain()
+        finally:
+            writer.close()
+    
+    async def _respond(self, request_line: str) -> Tuple[str, str, bytes]:
+        parts = request_line.split()
+        if len(parts) < 2:
+            return "400 Bad Request", 'text/plain', b"Malformed request\n"
+        
+        url = urllib.parse.urlsplit(parts[1])
+        if parts[0] != 'GET' or url.path != '/generate':
+            return "404 Not Found", 'text/plain', b"Use GET /generate?domain=<name>&rows=<n>\n"
+        
+        query = dict(urllib.parse.parse_qsl(url.query))
+        if 'domain' not in query:
+            return "400 Bad Request", 'text/plain', b"Missing 'domain' parameter\n"
+        
+        try:
+            output_format = query.get('format', 'csv')
+            body = await self.render(query['domain'], int(query.get('rows', 100)), output_format,
+                                     int(query['seed']) if 'seed' in query else None)
+        except KeyError as e:
+            return "404 Not Found", 'text/plain', f"{e.args[0] if e.args else e}\n".encode('utf-8')
+        except (ValueError, ImportError) as e:
+            return "400 Bad Request", 'text/plain', f"{e}\n".encode('utf-8')
+        
+        return "200 OK", CONTENT_TYPES[output_format], body
+
+async def serve(host: str = '127.0.0.1', port: int = 8080, **service_options):
+    async with GenerationService(**service_options) as service:
+        server = await asyncio.start_server(service.handle_http, host, port)
+        async with server:
+            print(f"Serving on http://{host}:{port}/generate", file=sys.stderr)
+            await server.serve_forever()
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m service', description="Serve synthetic data over HTTP.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('-w', '--workers', type=int, help="worker processes (default: one per CPU)")
+    parser.add_argument('--batch-window', type=float, default=DEFAULT_BATCH_WINDOW * 1000,
+                        help="milliseconds a small request waits for others to batch with")
+    parser.add_argument('--max-batch-rows', type=int, default=DEFAULT_MAX_BATCH_ROWS)
+    parser.add_argument('--columnar', action='store_true', help="use the columnar engine")
+    args = parser.parse_args(argv)
+    
+    try:
+        asyncio.run(serve(args.host, args.port, workers=args.workers, batch_window=args.batch_window / 1000,
+                          max_batch_rows=args.max_batch_rows, columnar=args.columnar))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,379 @@
+import math
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, Iterable, List, Optional
+
+SKETCH_SIZE = 2000
+HEAVY_HITTER_SIZE = 1000
+DISTINCT_SKETCH_SIZE = 4096
+_HASH_SPACE = float(2 ** 64)
+
+class MomentAccumulator:
+    """Count, mean and central moments up to the fourth, merged with the Chan/Pébay pairwise formulas."""
+    
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.m3 = 0.0
+        self.m4 = 0.0
+        self.min = np.nan
+        self.max = np.nan
+    
+    def update(self, values: np.ndarray):
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        if not len(values):
+            return
+        
+        chunk = MomentAccumulator()
+        chunk.count = len(values)
+        chunk.mean = float(values.mean())
+        deviations = values - chunk.mean
+        squared = deviations * deviations
+        chunk.m2 = float(squared.sum())
+        chunk.m3 = float((squared * deviations).sum())
+        chunk.m4 = float((squared * squared).sum())
+        chunk.min = float(values.min())
+        chunk.max = float(values.max())
+        self.merge(chunk)
+    
+    def merge(self, other: "MomentAccumulator"):
+        if not other.count:
+            return
+        if not self.count:
+            self.__dict__.update(other.__dict__)
+            return
+        
+        na, nb = self.count, other.count
+        n = na + nb
+        delta = other.mean - self.mean
+        delta_n = delta / n
+        
+        m4 = (self.m4 + other.m4
+              + delta * delta_n ** 3 * na * nb * (na * na - na * nb + nb * nb)
+              + 6 * delta_n ** 2 * (na * na * other.m2 + nb * nb * self.m2)
+              + 4 * delta_n * (na * other.m3 - nb * self.m3))
+        m3 = (self.m3 + other.m3
+              + delta * delta_n ** 2 * na * nb * (na - nb)
+              + 3 * delta_n * (na * other.m2 - nb * self.m2))
+        m2 = self.m2 + other.m2 + delta * delta_n * na * nb
+        
+        self.count = n
+        self.mean += delta_n * nb
+        self.m2, self.m3, self.m4 = m2, m3, m4
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+    
+    @property
+    def std(self) -> float:
+        """Sample standard deviation (ddof=1), as pandas reports it."""
+        if self.count < 2:
+            return np.nan
+        return float(np.sqrt(self.m2 / (self.count - 1)))
+    
+    @property
+    def skewness(self) -> float:
+        """Adjusted Fisher-Pearson skewness, matching Series.skew()."""
+        n = self.count
+        if n < 3:
+            return np.nan
+        if self.m2 <= 1e-14 * max(1.0, self.mean * self.mean) * n:
+            return 0.0
+        return float(np.sqrt(n * (n - 1)) / (n - 2) * np.sqrt(n) * self.m3 / self.m2 ** 1.5)
+    
+    @property
+    def kurtosis(self) -> float:
+        """Bias-corrected excess kurtosis, matching Series.kurtosis()."""
+        n = self.count
+        if n < 4:
+            return np.nan
+        if self.m2 <= 1e-14 * max(1.0, self.mean * self.mean) * n:
+            return 0.0
+        adjustment = 3 * (n - 1) ** 2 / ((n - 2) * (n - 3))
+        return float(n * (n + 1) * (n - 1) * self.m4 / ((n - 2) * (n - 3) * self.m2 ** 2) - adjustment)
+    
+    def normaltest(self) -> Optional[Dict[str, Any]]:
+        """D'Agostino-Pearson K² test (scipy.stats.normaltest) computed from the moments alone."""
+        n = self.count
+        if n < 8 or self.m2 <= 0:
+            return None
+        
+        # Skewness test on the biased sample skewness
+        b2 = self.m3 / n / (self.m2 / n) ** 1.5
+        y = b2 * math.sqrt((n + 1) * (n + 3) / (6.0 * (n - 2)))
+        beta2 = 3.0 * (n * n + 27 * n - 70) * (n + 1) * (n + 3) / ((n - 2.0) * (n + 5) * (n + 7) * (n + 9))
+        w2 = -1 + math.sqrt(2 * (beta2 - 1))
+        delta = 1 / math.sqrt(0.5 * math.log(w2))
+        alpha = math.sqrt(2.0 / (w2 - 1))
+        y = y if y != 0 else 1
+        z_skew = delta * math.log(y / alpha + math.sqrt((y / alpha) ** 2 + 1))
+        
+        # Kurtosis test on the biased (Pearson) sample kurtosis
+        b2 = self.m4 / n / (self.m2 / n) ** 2
+        expected = 3.0 * (n - 1) / (n + 1)
+        variance = 24.0 * n * (n - 2) * (n - 3) / ((n + 1) ** 2 * (n + 3) * (n + 5))
+        x = (b2 - expected) / math.sqrt(variance)
+        sqrt_beta1 = 6.0 * (n * n - 5 * n + 2) / ((n + 7) * (n + 9)) * math.sqrt(6.0 * (n + 3) * (n + 5) / (n * (n - 2) * (n - 3)))
+        a = 6.0 + 8.0 / sqrt_beta1 * (2.0 / sqrt_beta1 + math.sqrt(1 + 4.0 / sqrt_beta1 ** 2))
+        denominator = 1 + x * math.sqrt(2 / (a - 4.0))
+        if denominator == 0:
+            return None
+        term = math.copysign(abs((1 - 2 / a) / denominator) ** (1 / 3.0), denominator)
+        z_kurt = (1 - 2 / (9.0 * a) - term) / math.sqrt(2 / (9.0 * a))
+        
+        statistic = z_skew ** 2 + z_kurt ** 2
+        # Survival function of chi-squared with two degrees of freedom
+        p_value = math.exp(-statistic / 2)
+        return {
+            'statistic': statistic,
+            'p_value': p_value,
+            'is_normal': p_value > 0.05,
+            'sample_size': n
+        }
+
+class QuantileSketch:
+    """KLL-style compactor sketch: level h holds items of weight 2**h and halves itself when full.
+
+    With size=None nothing is ever compacted and quantiles are exact.
+    """
+    
+    def __init__(self, size: Optional[int] = SKETCH_SIZE, seed: int = 0):
+        self.size = size
+        self.levels: List[np.ndarray] = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+    
+    @property
+    def exact(self) -> bool:
+        return len(self.levels) == 1
+    
+    def update(self, values: np.ndarray):
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        if len(values):
+            self.levels[0] = np.concatenate([self.levels[0], values])
+            self._compact()
+    
+    def merge(self, other: "QuantileSketch"):
+        for height, items in enumerate(other.levels):
+            if height == len(self.levels):
+                self.levels.append(np.empty(0))
+            self.levels[height] = np.concatenate([self.levels[height], items])
+        self._compact()
+    
+    def _compact(self):
+        if self.size is None:
+            return
+        
+        height = 0
+        while height < len(self.levels):
+            items = self.levels[height]
+            if len(items) > self.size:
+                items = np.sort(items)
+                # An odd leftover stays behind so no weight is lost; a random offset keeps the halving unbiased.
+                keep = len(items) % 2
+                promoted = items[keep + self._rng.integers(2)::2][:(len(items) - keep) // 2]
+                self.levels[height] = items[:keep]
+                if height + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                self.levels[height + 1] = np.concatenate([self.levels[height + 1], promoted])
+            height += 1
+    
+    def _weighted_items(self):
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(level), 2.0 ** height) for height, level in enumerate(self.levels)])
+        order = np.argsort(items, kind='stable')
+        return items[order], weights[order]
+    
+    def count_outside(self, lower: float, upper: float) -> int:
+        """Estimated number of values below lower or above upper (exact while uncompacted)."""
+        items, weights = self._weighted_items()
+        cumulative = np.concatenate([[0.0], np.cumsum(weights)])
+        below = cumulative[np.searchsorted(items, lower, side='left')]
+        above = cumulative[-1] - cumulative[np.searchsorted(items, upper, side='right')]
+        return int(round(below + above))
+    
+    def quantiles(self, qs: Iterable[float]) -> List[float]:
+        qs = list(qs)
+        if self.exact:
+            if not len(self.levels[0]):
+                return [np.nan] * len(qs)
+            return [float(q) for q in np.quantile(self.levels[0], qs)]
+        
+        items, weights = self._weighted_items()
+        cumulative = np.cumsum(weights)
+        ranks = np.searchsorted(cumulative, np.asarray(qs) * cumulative[-1], side='left')
+        return [float(value) for value in items[np.minimum(ranks, len(items) - 1)]]
+
+class HeavyHitters:
+    """Misra-Gries frequent-value counters; exact while the number of distinct values fits, lower bounds after."""
+    
+    def __init__(self, size: Optional[int] = HEAVY_HITTER_SIZE):
+        self.size = size
+        self.counts: Dict[Any, int] = {}
+    
+    def update(self, values: pd.Series):
+        counts = values.value_counts()
+        # Categorical columns report every category, including ones that never occur.
+        self._add(counts[counts > 0].to_dict())
+    
+    def merge(self, other: "HeavyHitters"):
+        self._add(other.counts)
+    
+    def _add(self, counts: Dict[Any, int]):
+        for value, count in counts.items():
+            self.counts[value] = self.counts.get(value, 0) + int(count)
+        
+        if self.size is not None and len(self.counts) > self.size:
+            cutoff = sorted(self.counts.values(), reverse=True)[self.size]
+            self.counts = {value: count - cutoff for value, count in self.counts.items() if count > cutoff}
+    
+    def most_common(self, n: int = 5) -> Dict[Any, int]:
+        return dict(sorted(self.counts.items(), key=lambda item: item[1], reverse=True)[:n])
+
+class DistinctCounter:
+    """K-minimum-values distinct count over 64-bit hashes; exact below size distinct values."""
+    
+    def __init__(self, size: Optional[int] = DISTINCT_SKETCH_SIZE):
+        self.size = size
+        self.hashes = np.empty(0, dtype=np.uint64)
+    
+    def update(self, values: pd.Series):
+        self._add(pd.util.hash_array(values.dropna().to_numpy()))
+    
+    def merge(self, other: "DistinctCounter"):
+        self._add(other.hashes)
+    
+    def _add(self, hashes: np.ndarray):
+        self.hashes = np.unique(np.concatenate([self.hashes, hashes]))
+        if self.size is not None:
+            self.hashes = self.hashes[:self.size]
+    
+    @property
+    def estimate(self) -> int:
+        if self.size is None or len(self.hashes) < self.size:
+            return len(self.hashes)
+        return int(round((self.size - 1) / (float(self.hashes[-1]) / _HASH_SPACE)))
+
+class DistributionAccumulator:
+    """One-pass, mergeable equivalent of DataValidator.analyze_distributions over a stream of frames."""
+    
+    def __init__(self, exact: bool = False):
+        self.exact = exact
+        self.field_types: Dict[str, str] = {}
+        self.columns: Dict[str, Dict[str, Any]] = {}
+    
+    def _field_type(self, dtype) -> str:
+        # Boolean columns are categorical, not numeric
+        if pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype):
+            return 'numeric'
+        if pd.api.types.is_datetime64_any_dtype(dtype):
+            return 'date'
+        return 'categorical'
+    
+    def _new_column(self, field_type: str) -> Dict[str, Any]:
+        column = {'count': 0, 'null_count': 0}
+        if field_type == 'numeric':
+            column['moments'] = MomentAccumulator()
+            column['quantiles'] = QuantileSketch(None if self.exact else SKETCH_SIZE)
+        elif field_type == 'categorical':
+            column['heavy_hitters'] = HeavyHitters(None if self.exact else HEAVY_HITTER_SIZE)
+            column['distinct'] = DistinctCounter(None if self.exact else DISTINCT_SKETCH_SIZE)
+        else:
+            column['min'] = None
+            column['max'] = None
+        return column
+    
+    def update(self, df: pd.DataFrame) -> "DistributionAccumulator":
+        """Fold one frame (a chunk or a whole dataset) into the running summary."""
+        for name in df.columns:
+            series = df[name]
+            if name not in self.columns:
+                self.field_types[name] = self._field_type(series.dtype)
+                self.columns[name] = self._new_column(self.field_types[name])
+            
+            column = self.columns[name]
+            column['count'] += len(series)
+            column['null_count'] += int(series.isna().sum())
+            field_type = self.field_types[name]
+            
+            if field_type == 'numeric':
+                values = series.to_numpy(dtype=float, na_value=np.nan)
+                column['moments'].update(values)
+                column['quantiles'].update(values)
+            elif field_type == 'categorical':
+                column['heavy_hitters'].update(series)
+                column['distinct'].update(series)
+            else:
+                values = series.dropna()
+                if len(values):
+                    low, high = values.min(), values.max()
+                    column['min'] = low if column['min'] is None else min(column['min'], low)
+                    column['max'] = high if column['max'] is None else max(column['max'], high)
+        
+        return self
+    
+    def merge(self, other: "DistributionAccumulator") -> "DistributionAccumulator":
+        """Combine summaries built over disjoint parts of the data, e.g. by separate workers."""
+        for name, theirs in other.columns.items():
+            if name not in self.columns:
+                self.field_types[name] = other.field_types[name]
+                self.columns[name] = self._new_column(self.field_types[name])
+            
+            ours = self.columns[name]
+            ours['count'] += theirs['count']
+            ours['null_count'] += theirs['null_count']
+            
+            for key in ('moments', 'quantiles', 'heavy_hitters', 'distinct'):
+                if key in ours:
+                    ours[key].merge(theirs[key])
+            
+            if 'min' in ours and theirs['min'] is not None:
+                ours['min'] = theirs['min'] if ours['min'] is None else min(ours['min'], theirs['min'])
+                ours['max'] = theirs['max'] if ours['max'] is None else max(ours['max'], theirs['max'])
+        
+        return self
+    
+    def summary(self) -> Dict:
+        """The accumulated statistics in the analyze_distributions result layout."""
+        analysis = {
+            'numeric_summary': {},
+            'categorical_summary': {},
+            'date_summary': {},
+            'field_types': dict(self.field_types)
+        }
+        
+        for name, column in self.columns.items():
+            field_type = self.field_types[name]
+            
+            if field_type == 'numeric':
+                moments = column['moments']
+                q25, median, q75 = column['quantiles'].quantiles([0.25, 0.5, 0.75])
+                analysis['numeric_summary'][name] = {
+                    'count': column['count'],
+                    'mean': moments.mean if moments.count else np.nan,
+                    'std': moments.std,
+                    'min': moments.min,
+                    'max': moments.max,
+                    'median': median,
+                    'q25': q25,
+                    'q75': q75,
+                    'skewness': moments.skewness,
+                    'kurtosis': moments.kurtosis
+                }
+            elif field_type == 'categorical':
+                analysis['categorical_summary'][name] = {
+                    'count': column['count'],
+                    'unique_values': column['distinct'].estimate,
+                    'most_common': column['heavy_hitters'].most_common(5),
+                    'null_count': column['null_count']
+                }
+            else:
+                analysis['date_summary'][name] = {
+                    'count': column['count'],
+                    'min_date': column['min'],
+                    'max_date': column['max'],
+                    'date_range_days': (column['max'] - column['min']).days if column['min'] is not None else 0
+                }
+        
+        return analysis
@@ -1,80 +1,124 @@
+import hashlib
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from scipy import stats
-from typing import Dict, List, Tuple, Optional
-import streamlit as st
+from typing import Any, Dict, Iterable, List, Mapping, Tuple, Optional
+from collections import OrderedDict
+from dataclasses import dataclass
+from types import MappingProxyType
+from consistency import applicable_rules, compile_rules, find_consistency_violations, rule_mask
+from streaming_stats import DistributionAccumulator
+
+# matplotlib and scipy are imported inside the methods that need them: importing this module
+# (e.g. in worker processes or the CLI) should not pay their startup cost.
+
+# Frames up to this size are summarized exactly; larger ones use mergeable sketches.
+EXACT_ROW_LIMIT = 1_000_000
+DEFAULT_CHUNK_SIZE = 100_000
+ANALYSIS_CACHE_SIZE = 32
+
+def frame_fingerprint(df: pd.DataFrame) -> str:
+    """Cheap content hash of a frame: shape, column names, dtypes and a hash of each column's values."""
+    digest = hashlib.sha256(repr((df.shape, list(df.columns), [str(dtype) for dtype in df.dtypes])).encode())
+    for column in df.columns:
+        digest.update(pd.util.hash_pandas_object(df[column], index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+def _freeze(value: Any) -> Any:
+    """Read-only view of nested dicts (e.g. most_common inside a categorical summary)."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    return value
+
+def _thaw(value: Any) -> Any:
+    """Plain, mutable deep copy of a frozen mapping."""
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    return value
+
+@dataclass(frozen=True)
+class DistributionAnalysis:
+    """Read-only result of analyze_distributions; analysis['numeric_summary'] etc. return copies."""
+    numeric_summary: Mapping[str, Mapping[str, Any]]
+    categorical_summary: Mapping[str, Mapping[str, Any]]
+    date_summary: Mapping[str, Mapping[str, Any]]
+    field_types: Mapping[str, str]
+    
+    @classmethod
+    def from_summary(cls, summary: Dict) -> "DistributionAnalysis":
+        return cls(
+            numeric_summary=_freeze(summary['numeric_summary']),
+            categorical_summary=_freeze(summary['categorical_summary']),
+            date_summary=_freeze(summary['date_summary']),
+            field_types=_freeze(summary['field_types'])
+        )
+    
+    def _fields(self, field_type: str) -> Tuple[str, ...]:
+        return tuple(field for field, kind in self.field_types.items() if kind == field_type)
+    
+    @property
+    def numeric_fields(self) -> Tuple[str, ...]:
+        return self._fields('numeric')
+    
+    @property
+    def categorical_fields(self) -> Tuple[str, ...]:
+        return self._fields('categorical')
+    
+    @property
+    def date_fields(self) -> Tuple[str, ...]:
+        return self._fields('date')
+    
+    def __getitem__(self, key: str) -> Dict:
+        if key not in self.__dataclass_fields__:
+            raise KeyError(key)
+        
+        # Plain, mutable deep copies so callers (and pandas) can use them freely without touching the cached result.
+        return _thaw(getattr(self, key))
+    
+    def to_dict(self) -> Dict:
+        return {key: self[key] for key in self.__dataclass_fields__}
+
+_ANALYSIS_CACHE: "OrderedDict[Tuple[str, bool], DistributionAnalysis]" = OrderedDict()
 
 class DataValidator:
     
-    def __init__(self):
-        self.numeric_fields = []
-        self.categorical_fields = []
-        self.date_fields = []
-    
-    def analyze_distributions(self, df: pd.DataFrame) -> Dict:
-        """Analyze distributions of all fields in the dataset."""
-        analysis = {
-            'numeric_summary': {},
-            'categorical_summary': {},
-            'date_summary': {},
-            'field_types': {}
-        }
+    def __init__(self, schema: Optional[Dict] = None):
+        # The schema's declared cross-field rules; without a schema, the name-based built-ins.
+        self.rules = compile_rules(schema) if schema is not None else None
+    
+    def analyze_distributions(self, df: pd.DataFrame, exact: Optional[bool] = None) -> DistributionAnalysis:
+        """Analyze distributions of all fields in the dataset, reusing the result for identical frames."""
+        if exact is None:
+            exact = len(df) <= EXACT_ROW_LIMIT
+        
+        key = (frame_fingerprint(df), exact)
+        analysis = _ANALYSIS_CACHE.get(key)
+        if analysis is not None:
+            _ANALYSIS_CACHE.move_to_end(key)
+            return analysis
         
-        for column in df.columns:
-            dtype = df[column].dtype
-            # Exclude boolean columns from numeric analysis
-            if pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype):
-                analysis['field_types'][column] = 'numeric'
-                analysis['numeric_summary'][column] = {
-                    'count': len(df[column]),
-                    'mean': df[column].mean(),
-                    'std': df[column].std(),
-                    'min': df[column].min(),
-                    'max': df[column].max(),
-                    'median': df[column].median(),
-                    'q25': df[column].quantile(0.25),
-                    'q75': df[column].quantile(0.75),
-                    'skewness': df[column].skew(),
-                    'kurtosis': df[column].kurtosis()
-                }
-                self.numeric_fields.append(column)
-            elif pd.api.types.is_bool_dtype(dtype):
-                # Treat boolean columns as categorical
-                analysis['field_types'][column] = 'categorical'
-                value_counts = df[column].value_counts()
-                analysis['categorical_summary'][column] = {
-                    'count': len(df[column]),
-                    'unique_values': len(value_counts),
-                    'most_common': value_counts.head(5).to_dict(),
-                    'null_count': df[column].isnull().sum()
-                }
-                self.categorical_fields.append(column)
-            elif pd.api.types.is_datetime64_any_dtype(dtype):
-                analysis['field_types'][column] = 'date'
-                analysis['date_summary'][column] = {
-                    'count': len(df[column]),
-                    'min_date': df[column].min(),
-                    'max_date': df[column].max(),
-                    'date_range_days': (df[column].max() - df[column].min()).days
-                }
-                self.date_fields.append(column)
-            else:
-                analysis['field_types'][column] = 'categorical'
-                value_counts = df[column].value_counts()
-                analysis['categorical_summary'][column] = {
-                    'count': len(df[column]),
-                    'unique_values': len(value_counts),
-                    'most_common': value_counts.head(5).to_dict(),
-                    'null_count': df[column].isnull().sum()
-                }
-                self.categorical_fields.append(column)
+        accumulator = DistributionAccumulator(exact=exact)
+        for start in range(0, max(len(df), 1), DEFAULT_CHUNK_SIZE):
+            accumulator.update(df.iloc[start:start + DEFAULT_CHUNK_SIZE])
+        
+        analysis = DistributionAnalysis.from_summary(accumulator.summary())
+        _ANALYSIS_CACHE[key] = analysis
+        if len(_ANALYSIS_CACHE) > ANALYSIS_CACHE_SIZE:
+            _ANALYSIS_CACHE.popitem(last=False)
         
         return analysis
     
+    def analyze_chunks(self, chunks: Iterable[pd.DataFrame], exact: bool = False) -> DistributionAnalysis:
+        """Analyze a stream of frames in one pass, e.g. SyntheticDataGenerator.generate_chunks output."""
+        accumulator = DistributionAccumulator(exact=exact)
+        for chunk in chunks:
+            accumulator.update(chunk)
+        
+        return DistributionAnalysis.from_summary(accumulator.summary())
+    
     def generate_histograms(self, df: pd.DataFrame, numeric_fields: List[str]) -> Dict:
         """Generate histogram plots for numeric fields."""
+        import matplotlib.pyplot as plt
+        
         plots = {}
         
         for field in numeric_fields:
@@ -101,6 +145,8 @@ class DataValidator:
         if len(data) < 3:
             return None
         
+        from scipy import stats
+        
         try:
             statistic, p_value = stats.normaltest(data)
             return {
@@ -126,6 +172,8 @@ class DataValidator:
         if len(data1) < 3 or len(data2) < 3:
             return None
         
+        from scipy import stats
+        
         try:
             statistic, p_value = stats.ks_2samp(data1, data2)
             return {
@@ -164,6 +212,8 @@ class DataValidator:
             }
         
         elif method == 'zscore':
+            from scipy import stats
+            
             z_scores = np.abs(stats.zscore(data))
             outliers = data[z_scores > 3]
             
@@ -176,38 +226,38 @@ class DataValidator:
         
         return None
     
+    def find_consistency_violations(self, df: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """Evaluate cross-field rules as column masks, returning failing row indexes per rule."""
+        return find_consistency_violations(df, self.rules)
+    
     def validate_cross_field_consistency(self, df: pd.DataFrame) -> List[Dict]:
         """Validate cross-field consistency rules."""
-        issues = []
-        
-        for idx, row in df.iterrows():
-            if 'admit_date' in df.columns and 'discharge_date' in df.columns:
-                if pd.notna(row['admit_date']) and pd.notna(row['discharge_date']):
-                    if row['discharge_date'] < row['admit_date']:
-                        issues.append({
-                            'row': idx,
-                            'issue': 'Discharge date before admit date',
-                            'fields': ['admit_date', 'discharge_date']
-                        })
-            
-            if 'order_date' in df.columns and 'shipping_date' in df.columns:
-                if pd.notna(row['order_date']) and pd.notna(row['shipping_date']):
-                    if row['shipping_date'] < row['order_date']:
-                        issues.append({
-                            'row': idx,
-                            'issue': 'Shipping date before order date',
-                            'fields': ['order_date', 'shipping_date']
-                        })
-            
-            if 'age' in df.columns:
-                if pd.notna(row['age']) and (row['age'] < 0 or row['age'] > 120):
-                    issues.append({
-                        'row': idx,
-                        'issue': 'Age out of reasonable range',
-                        'fields': ['age']
-                    })
+        rules = applicable_rules(df, self.rules)
+        positions = []
+        rule_ids = []
+        
+        for rule_id, rule in enumerate(rules):
+            rows = np.flatnonzero(rule_mask(df, rule))
+            positions.append(rows)
+            rule_ids.append(np.full(len(rows), rule_id))
+        
+        if not positions:
+            return []
+        
+        # Report in row order, like a row-by-row scan would.
+        positions = np.concatenate(positions)
+        rule_ids = np.concatenate(rule_ids)
+        order = np.lexsort((rule_ids, positions))
+        labels = df.index.tolist()
         
-        return issues
+        return [
+            {
+                'row': labels[position],
+                'issue': rules[rule_id]['issue'],
+                'fields': list(rules[rule_id]['fields'])
+            }
+            for position, rule_id in zip(positions[order].tolist(), rule_ids[order].tolist())
+        ]
     
     def generate_summary_report(self, df: pd.DataFrame) -> str:
         """Generate a comprehensive summary report."""
@@ -216,20 +266,105 @@ class DataValidator:
         report = f"Dataset Summary Report\n{'='*50}\n"
         report += f"Total Rows: {len(df)}\n"
         report += f"Total Columns: {len(df.columns)}\n"
-        report += f"Numeric Fields: {len(self.numeric_fields)}\n"
-        report += f"Categorical Fields: {len(self.categorical_fields)}\n"
-        report += f"Date Fields: {len(self.date_fields)}\n\n"
+        report += f"Numeric Fields: {len(analysis.numeric_fields)}\n"
+        report += f"Categorical Fields: {len(analysis.categorical_fields)}\n"
+        report += f"Date Fields: {len(analysis.date_fields)}\n\n"
         
-        if self.numeric_fields:
+        if analysis.numeric_fields:
             report += "Numeric Field Statistics:\n"
-            for field in self.numeric_fields:
-                stats = analysis['numeric_summary'][field]
+            for field in analysis.numeric_fields:
+                stats = analysis.numeric_summary[field]
                 report += f"  {field}: mean={stats['mean']:.2f}, std={stats['std']:.2f}, range=[{stats['min']:.2f}, {stats['max']:.2f}]\n"
         
-        if self.categorical_fields:
+        if analysis.categorical_fields:
             report += "\nCategorical Field Summary:\n"
-            for field in self.categorical_fields:
-                stats = analysis['categorical_summary'][field]
+            for field in analysis.categorical_fields:
+                stats = analysis.categorical_summary[field]
                 report += f"  {field}: {stats['unique_values']} unique values\n"
         
-        return report 
\ No newline at end of file
+        return report
+
+class IncrementalValidator:
+    """Validation summaries kept up to date batch by batch while a generator produces chunks.
+    
+    Subscribe it to a SyntheticDataGenerator and the report (statistics, outlier bounds and
+    counts, normality and consistency counts) is ready as soon as generation finishes, without
+    a second pass over the data.
+    """
+    
+    def __init__(self, schema: Optional[Dict] = None, exact: bool = False):
+        self.rules = compile_rules(schema) if schema is not None else None
+        self.accumulator = DistributionAccumulator(exact=exact)
+        self.row_count = 0
+        self.inconsistent_rows = 0
+        self.violations: Dict[str, int] = {}
+    
+    def attach(self, generator) -> "IncrementalValidator":
+        generator.subscribe(self.update)
+        return self
+    
+    def update(self, chunk: pd.DataFrame):
+        """Fold one generated chunk into the running statistics and consistency counts."""
+        self.accumulator.update(chunk)
+        self.row_count += len(chunk)
+        
+        bad = np.zeros(len(chunk), dtype=bool)
+        for rule in applicable_rules(chunk, self.rules):
+            mask = rule_mask(chunk, rule)
+            self.violations[rule['issue']] = self.violations.get(rule['issue'], 0) + int(mask.sum())
+            bad |= mask
+        self.inconsistent_rows += int(bad.sum())
+    
+    def _numeric_column(self, field: str) -> Optional[Dict]:
+        if self.accumulator.field_types.get(field) != 'numeric':
+            return None
+        return self.accumulator.columns[field]
+    
+    def detect_outliers(self, field: str, method: str = 'iqr') -> Dict:
+        """Outlier bounds and counts for a numeric field; individual values are not retained."""
+        column = self._numeric_column(field)
+        if column is None or column['moments'].count < 3:
+            return None
+        
+        moments = column['moments']
+        if method == 'iqr':
+            q1, q3 = column['quantiles'].quantiles([0.25, 0.75])
+            lower_bound = q1 - 1.5 * (q3 - q1)
+            upper_bound = q3 + 1.5 * (q3 - q1)
+        elif method == 'zscore':
+            # scipy.stats.zscore uses the population standard deviation
+            std = np.sqrt(moments.m2 / moments.count)
+            lower_bound = moments.mean - 3 * std
+            upper_bound = moments.mean + 3 * std
+        else:
+            return None
+        
+        outlier_count = column['quantiles'].count_outside(lower_bound, upper_bound)
+        return {
+            'outlier_count': outlier_count,
+            'outlier_percentage': outlier_count / moments.count * 100,
+            'lower_bound': lower_bound,
+            'upper_bound': upper_bound
+        }
+    
+    def test_normality(self, field: str) -> Dict:
+        column = self._numeric_column(field)
+        if column is None:
+            return None
+        return column['moments'].normaltest()
+    
+    def report(self) -> Dict:
+        """Everything accumulated so far, in the layout the DataValidator methods return."""
+        analysis = DistributionAnalysis.from_summary(self.accumulator.summary())
+        numeric_fields = analysis.numeric_fields
+        
+        return {
+            'row_count': self.row_count,
+            'analysis': analysis,
+            'outliers': {field: self.detect_outliers(field) for field in numeric_fields},
+            'normality': {field: self.test_normality(field) for field in numeric_fields},
+            'consistency': {
+                'inconsistent_rows': self.inconsistent_rows,
+                'violations': dict(self.violations)
+            }
+        }
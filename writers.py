@@ -0,0 +1,223 @@
+"""Streaming writers that append generated chunks to disk one at a time.
+
+CSV and JSON Lines need only pandas; Parquet and Arrow IPC need the optional pyarrow package.
+"""
+import bz2
+import gzip
+import io
+import lzma
+import sys
+from typing import IO, Any, Dict, Iterable, Optional, Tuple, Union
+import pandas as pd
+from generator import DEFAULT_CHUNK_SIZE, CompiledField
+
+Sink = Union[str, IO]
+
+_COMPRESSORS = {'.gz': gzip.open, '.bz2': bz2.open, '.xz': lzma.open}
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+        return pyarrow
+    except ImportError:
+        raise ImportError("Parquet and Arrow output require pyarrow: pip install pyarrow")
+
+def infer_format(path: str) -> str:
+    """Output format implied by a file name, ignoring a compression suffix."""
+    name = path.lower()
+    for suffix in _COMPRESSORS:
+        if name.endswith(suffix):
+            name = name[:-len(suffix)]
+    
+    if name.endswith('.parquet') or name.endswith('.pq'):
+        return 'parquet'
+    if name.endswith('.arrow') or name.endswith('.feather') or name.endswith('.ipc'):
+        return 'arrow'
+    if name.endswith('.jsonl') or name.endswith('.json'):
+        return 'jsonl'
+    return 'csv'
+
+class ChunkWriter:
+    """Append DataFrame chunks to one output; use as a context manager or call close()."""
+    
+    def __init__(self, sink: Sink, plan: Optional[Tuple[CompiledField, ...]] = None):
+        self.sink = sink
+        self.plan = plan
+        self.rows_written = 0
+    
+    def write(self, chunk: pd.DataFrame):
+        self._write(chunk)
+        self.rows_written += len(chunk)
+    
+    def _write(self, chunk: pd.DataFrame):
+        raise NotImplementedError
+    
+    def close(self):
+        pass
+    
+    def __enter__(self) -> "ChunkWriter":
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
+class _TextWriter(ChunkWriter):
+    
+    def __init__(self, sink: Sink, plan: Optional[Tuple[CompiledField, ...]] = None):
+        super().__init__(sink, plan)
+        if sink == '-':
+            self.handle, self._owned = sys.stdout, False
+        elif isinstance(sink, str):
+            compressor = next((opener for suffix, opener in _COMPRESSORS.items() if sink.lower().endswith(suffix)), None)
+            self.handle = compressor(sink, 'wt', newline='') if compressor else open(sink, 'w', newline='')
+            self._owned = True
+        else:
+            self.handle, self._owned = sink, False
+    
+    def close(self):
+        if self._owned:
+            self.handle.close()
+        else:
+            self.handle.flush()
+
+class CSVWriter(_TextWriter):
+    """CSV with a single header; .gz, .bz2 and .xz paths are compressed as they stream."""
+    
+    def _write(self, chunk: pd.DataFrame):
+        chunk.to_csv(self.handle, header=self.rows_written == 0, index=False)
+
+class JSONLinesWriter(_TextWriter):
+    
+    def _write(self, chunk: pd.DataFrame):
+        # pandas ends line-delimited output with a newline, so chunks concatenate cleanly.
+        if len(chunk):
+            chunk.to_json(self.handle, orient='records', lines=True, date_format='iso')
+
+class _ArrowWriter(ChunkWriter):
+    """Shared Arrow conversion: choice columns dictionary-encoded, date fields stored as date32."""
+    
+    def __init__(self, sink: Sink, plan: Optional[Tuple[CompiledField, ...]] = None):
+        super().__init__(sink, plan)
+        self.pa = _require_pyarrow()
+        self.schema = None
+        self._writer = None
+        kinds = {field.name: field.kind for field in plan or ()}
+        self.dictionary_columns = [name for name, kind in kinds.items() if kind == 'choice']
+        self.date_columns = [name for name, kind in kinds.items() if kind == 'date']
+        self._dictionaries: Dict[str, pd.Index] = {}
+    
+    def _arrow_schema(self, chunk: pd.DataFrame):
+        pa = self.pa
+        schema = pa.Schema.from_pandas(chunk, preserve_index=False).remove_metadata()
+        for name in self.dictionary_columns:
+            if name in chunk.columns:
+                index = schema.get_field_index(name)
+                value_type = schema.field(name).type
+                if pa.types.is_dictionary(value_type):
+                    value_type = value_type.value_type
+                schema = schema.set(index, pa.field(name, pa.dictionary(pa.int32(), value_type)))
+                self._dictionaries[name] = pd.Index([], dtype=object)
+        for name in self.date_columns:
+            if name in chunk.columns:
+                schema = schema.set(schema.get_field_index(name), pa.field(name, pa.date32()))
+        return schema
+    
+    def _dictionary_array(self, name: str, values: pd.Series, arrow_type):
+        # The dictionary only ever grows, so each batch's dictionary extends the previous one;
+        # that lets IPC files store deltas instead of (unsupported) dictionary replacements.
+        dictionary = self._dictionaries[name]
+        values = values.astype(object)
+        new_values = pd.Index(values.dropna().unique()).difference(dictionary, sort=False)
+        if len(new_values):
+            dictionary = self._dictionaries[name] = dictionary.append(new_values)
+        
+        codes = dictionary.get_indexer(values)
+        indices = self.pa.array(codes, type=self.pa.int32(), mask=codes < 0)
+        return self.pa.DictionaryArray.from_arrays(indices, self.pa.array(dictionary, type=arrow_type.value_type))
+    
+    def _write(self, chunk: pd.DataFrame):
+        if self.schema is None:
+            self.schema = self._arrow_schema(chunk)
+            self._writer = self._open(self.schema)
+        
+        columns = []
+        for field in self.schema:
+            if field.name in self._dictionaries:
+                columns.append(self._dictionary_array(field.name, chunk[field.name], field.type))
+            else:
+                columns.append(self.pa.array(chunk[field.name], from_pandas=True).cast(field.type))
+        self._writer.write_table(self.pa.Table.from_arrays(columns, schema=self.schema))
+    
+    def _open(self, schema):
+        raise NotImplementedError
+    
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+
+class ParquetWriter(_ArrowWriter):
+    """Parquet file with one row group per chunk."""
+    
+    def __init__(self, sink: Sink, plan: Optional[Tuple[CompiledField, ...]] = None, compression: str = 'zstd'):
+        super().__init__(sink, plan)
+        self.compression = compression
+    
+    def _open(self, schema):
+        import pyarrow.parquet as pq
+        return pq.ParquetWriter(self.sink, schema, compression=self.compression,
+                                use_dictionary=self.dictionary_columns or False)
+
+class ArrowIPCWriter(_ArrowWriter):
+    """Arrow IPC file (Feather v2), one record batch per chunk."""
+    
+    def _open(self, schema):
+        options = self.pa.ipc.IpcWriteOptions(emit_dictionary_deltas=True)
+        return self.pa.ipc.new_file(self.sink, schema, options=options)
+
+WRITERS = {
+    'csv': CSVWriter,
+    'jsonl': JSONLinesWriter,
+    'parquet': ParquetWriter,
+    'arrow': ArrowIPCWriter,
+}
+
+# File name suffix per format, for outputs named by the caller (e.g. one file per table).
+EXTENSIONS = {
+    'csv': '.csv',
+    'jsonl': '.jsonl',
+    'parquet': '.parquet',
+    'arrow': '.arrow',
+}
+
+def open_writer(sink: Sink, output_format: Optional[str] = None, plan: Optional[Tuple[CompiledField, ...]] = None) -> ChunkWriter:
+    """A writer for a path (format inferred from its name) or an open file object (format required)."""
+    if output_format is None:
+        output_format = infer_format(sink) if isinstance(sink, str) else 'csv'
+    if output_format not in WRITERS:
+        raise ValueError(f"Unknown output format '{output_format}'; expected one of {', '.join(WRITERS)}")
+    return WRITERS[output_format](sink, plan)
+
+def write_chunks(chunks: Iterable[pd.DataFrame], sink: Sink, output_format: Optional[str] = None,
+                 plan: Optional[Tuple[CompiledField, ...]] = None) -> int:
+    """Stream chunks into one output and return the number of rows written."""
+    with open_writer(sink, output_format, plan) as writer:
+        for chunk in chunks:
+            writer.write(chunk)
+    return writer.rows_written
+
+def write_dataset(generator, schema: Dict[str, Any], num_rows: int, sink: Sink, output_format: Optional[str] = None,
+                  chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """Generate straight to disk; memory stays bounded by one chunk however large num_rows is."""
+    plan = generator.compile_schema(schema)
+    return write_chunks(generator.generate_chunks(schema, num_rows, chunk_size), sink, output_format, plan)
+
+def to_bytes(df: pd.DataFrame, output_format: str, plan: Optional[Tuple[CompiledField, ...]] = None) -> bytes:
+    """Serialize a frame in memory, e.g. for a download button."""
+    if output_format in ('csv', 'jsonl'):
+        buffer = io.StringIO()
+        write_chunks([df], buffer, output_format, plan)
+        return buffer.getvalue().encode('utf-8')
+    
+    buffer = io.BytesIO()
+    write_chunks([df], buffer, output_format, plan)
+    return buffer.getvalue()